@@ -4,19 +4,25 @@ Collection API endpoints for Pokédex-style geometric element collection.
 Handles element discovery, collection mechanics, and progression tracking.
 """
 
-from typing import Dict, List, Optional, Any
+import sys
+from collections import Counter, defaultdict, deque
+from typing import AbstractSet, Dict, List, Optional, Any
 from datetime import datetime
+from functools import lru_cache
 from uuid import uuid4
 
 from fastapi import APIRouter, HTTPException, Depends, status
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
 import structlog
 
-from app.services.rust_bridge import RustGeometryService, ConstructionSpace
+from app.services.rust_bridge import (
+    RustGeometryService, ConstructionSpace, get_rust_service as get_shared_rust_service
+)
 from app.core.exceptions import CollectionError
 
 logger = structlog.get_logger()
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 class CollectionElement(BaseModel):
     """A collectable geometric element."""
@@ -31,6 +37,14 @@ class CollectionElement(BaseModel):
     is_unlocked: bool = False
     usage_count: int = 0
 
+# PlayerCollection counter field maintained for each rarity
+_RARITY_COUNT_FIELDS = {
+    "common": "common_count",
+    "uncommon": "uncommon_count",
+    "rare": "rare_count",
+    "legendary": "legendary_count"
+}
+
 class PlayerCollection(BaseModel):
     """Player's collection of geometric elements."""
     player_id: str
@@ -45,19 +59,42 @@ class PlayerCollection(BaseModel):
     achievements: List[str] = []
     current_level: int = 1
     experience_points: int = 0
+    
+    def add_element(self, element: CollectionElement) -> None:
+        """Add an element, updating the aggregate counters instead of re-deriving them."""
+        if element.id in self.elements:
+            return
+        self.elements[element.id] = element
+        self.total_elements += 1
+        self.unique_elements += 1
+        count_field = _RARITY_COUNT_FIELDS.get(element.rarity)
+        if count_field:
+            setattr(self, count_field, getattr(self, count_field) + 1)
 
 class ElementUnlockRequest(BaseModel):
     """Request to unlock a new element."""
     player_id: str
     construction_space: ConstructionSpace
     completed_construction: str = Field(..., description="Name of completed construction")
+    owned_elements: Optional[List[str]] = Field(
+        None, description="Element IDs the player already owns; enforces unlock requirements"
+    )
 
 class CollectionStatsResponse(BaseModel):
     """Collection statistics response."""
+    model_config = ConfigDict(frozen=True)
+    
     collection: PlayerCollection
     available_elements: List[CollectionElement]
     next_unlockable: List[CollectionElement]
 
+class BatchCollectionRequest(BaseModel):
+    """Request for several players' collections at once."""
+    player_ids: List[str] = Field(
+        ..., min_length=1, max_length=100, description="Player IDs to fetch collections for"
+    )
+    include_locked: bool = False
+
 # Predefined collection elements
 COLLECTION_ELEMENTS = {
     "basic_point": CollectionElement(
@@ -160,9 +197,88 @@ COLLECTION_ELEMENTS = {
     )
 }
 
+# Rarity and category come from a tiny closed vocabulary; intern them so
+# filter comparisons short-circuit on identity
+for _element in COLLECTION_ELEMENTS.values():
+    _element.rarity = sys.intern(_element.rarity)
+    _element.category = sys.intern(_element.category)
+
+# Experience awarded per unlocked element, by rarity
+_RARITY_XP = {
+    "common": 10,
+    "uncommon": 25,
+    "rare": 50,
+    "legendary": 100
+}
+
+# Construction pattern recognition rules: (pattern, predicate(lines, circles, points))
+_PATTERN_RULES = (
+    ("equilateral_triangle", lambda lc, cc, pc: lc == 3 and cc >= 2 and pc >= 3),
+    ("perpendicular_bisector", lambda lc, cc, pc: lc >= 2 and cc >= 2),
+    ("circle", lambda lc, cc, pc: cc >= 1),
+    ("line_segment", lambda lc, cc, pc: lc >= 1),
+)
+
+# Element unlock heuristics: element id -> predicate(lines, circles)
+_UNLOCK_RULES = {
+    "line_segment": lambda lc, cc: lc > 0,
+    "circle": lambda lc, cc: cc > 0,
+    "equilateral_triangle": lambda lc, cc: lc >= 3 and cc >= 2,
+    "perpendicular_bisector": lambda lc, cc: lc >= 2 and cc >= 2,
+}
+
+# Static unlock-dependency index, built once from the catalog above
+_UNLOCK_REQS = {eid: frozenset(e.unlock_requirements) for eid, e in COLLECTION_ELEMENTS.items()}
+_DEPENDENTS = defaultdict(set)
+for _eid, _reqs in _UNLOCK_REQS.items():
+    for _req in _reqs:
+        _DEPENDENTS[_req].add(_eid)
+_CATALOG_ORDER = {eid: i for i, eid in enumerate(COLLECTION_ELEMENTS)}
+
+def _topological_order() -> List[str]:
+    """Order element IDs so each element follows all of its unlock requirements (Kahn)."""
+    in_degree = {eid: len(reqs) for eid, reqs in _UNLOCK_REQS.items()}
+    ready = deque(eid for eid, degree in in_degree.items() if degree == 0)
+    order = []
+    
+    while ready:
+        eid = ready.popleft()
+        order.append(eid)
+        # Visit dependents in catalog order so the result is deterministic
+        for dependent in sorted(_DEPENDENTS.get(eid, ()), key=_CATALOG_ORDER.__getitem__):
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                ready.append(dependent)
+    
+    if len(order) != len(in_degree):
+        raise ValueError("Collection element unlock requirements are cyclic or reference unknown elements")
+    return order
+
+_TOPO_ORDER = _topological_order()
+
+# Catalog entries are immutable, so serialize them once and reuse the dicts
+_ELEMENT_DICT_CACHE = {eid: e.model_dump() for eid, e in COLLECTION_ELEMENTS.items()}
+
+# Completed-construction names map to elements by their snake_case display name
+_BY_NAME_SLUG = {e.name.lower().replace(" ", "_"): e for e in COLLECTION_ELEMENTS.values()}
+
+# Filter indexes for list_elements
+_ALL_ELEMENTS = list(COLLECTION_ELEMENTS.values())
+_UNLOCKED_ELEMENTS = [e for e in _ALL_ELEMENTS if e.is_unlocked]
+_BY_CATEGORY = defaultdict(list)
+_BY_RARITY = defaultdict(list)
+for _element in _ALL_ELEMENTS:
+    _BY_CATEGORY[_element.category].append(_element)
+    _BY_RARITY[_element.rarity].append(_element)
+_COUNTS_BY_CATEGORY = {k: len(v) for k, v in _BY_CATEGORY.items()}
+_CATEGORY_COLUMN = tuple(e.category for e in _ALL_ELEMENTS)
+_RARITY_COLUMN = tuple(e.rarity for e in _ALL_ELEMENTS)
+_UNLOCKED_COLUMN = tuple(e.is_unlocked for e in _ALL_ELEMENTS)
+_COUNTS_BY_RARITY = {k: len(v) for k, v in _BY_RARITY.items()}
+
 async def get_rust_service() -> RustGeometryService:
-    """Get the Rust geometry service."""
-    return RustGeometryService()
+    """Get the shared Rust geometry service."""
+    return get_shared_rust_service()
 
 @router.get(
     "/player/{player_id}",
@@ -176,49 +292,16 @@ async def get_player_collection(
 ):
     """Get player's collection."""
     try:
-        # In a real app, this would load from database
-        # For now, create a default collection
-        collection = PlayerCollection(
-            player_id=player_id,
-            username=f"Player_{player_id[:8]}",
-            elements={
-                "basic_point": COLLECTION_ELEMENTS["basic_point"].copy(deep=True)
-            }
-        )
-        
-        # Update stats
-        collection.total_elements = len(collection.elements)
-        collection.unique_elements = len(collection.elements)
-        collection.common_count = sum(1 for e in collection.elements.values() if e.rarity == "common")
-        collection.uncommon_count = sum(1 for e in collection.elements.values() if e.rarity == "uncommon")
-        collection.rare_count = sum(1 for e in collection.elements.values() if e.rarity == "rare")
-        collection.legendary_count = sum(1 for e in collection.elements.values() if e.rarity == "legendary")
-        
-        # Get available elements
-        available = list(COLLECTION_ELEMENTS.values()) if include_locked else [
-            e for e in COLLECTION_ELEMENTS.values() if e.is_unlocked or e.id in collection.elements
-        ]
-        
-        # Find next unlockable elements
-        owned_ids = set(collection.elements.keys())
-        next_unlockable = [
-            element for element in COLLECTION_ELEMENTS.values()
-            if (element.id not in owned_ids and 
-                all(req in owned_ids for req in element.unlock_requirements))
-        ]
+        response = _build_collection_response(player_id, include_locked)
         
         logger.info(
             "Retrieved player collection",
             player_id=player_id,
-            total_elements=collection.total_elements,
-            next_unlockable=len(next_unlockable)
+            total_elements=response.collection.total_elements,
+            next_unlockable=len(response.next_unlockable)
         )
         
-        return CollectionStatsResponse(
-            collection=collection,
-            available_elements=available,
-            next_unlockable=next_unlockable
-        )
+        return response
         
     except Exception as e:
         logger.error("Failed to get player collection", player_id=player_id, error=str(e))
@@ -227,6 +310,31 @@ async def get_player_collection(
             detail=f"Failed to retrieve collection: {str(e)}"
         )
 
+@router.post(
+    "/player/batch",
+    response_model=Dict[str, CollectionStatsResponse],
+    summary="Get Player Collections (Batch)",
+    description="Get complete element collections for several players in a single call"
+)
+async def get_player_collections_batch(request: BatchCollectionRequest):
+    """Get collections for multiple players, keyed by player ID."""
+    try:
+        responses = {
+            player_id: _build_collection_response(player_id, request.include_locked)
+            for player_id in request.player_ids
+        }
+        
+        logger.info("Retrieved player collections batch", player_count=len(responses))
+        
+        return responses
+        
+    except Exception as e:
+        logger.error("Failed to get player collections batch", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve collections: {str(e)}"
+        )
+
 @router.post(
     "/unlock-element",
     response_model=Dict[str, Any],
@@ -246,23 +354,19 @@ async def unlock_element(
         unlocked_elements = []
         experience_gained = 0
         
-        for element_id, element in COLLECTION_ELEMENTS.items():
-            if (element.name.lower().replace(" ", "_") == request.completed_construction.lower() and
-                _can_unlock_element(element, request.construction_space)):
-                
-                unlocked_element = element.copy(deep=True)
-                unlocked_element.discovery_date = datetime.now()
-                unlocked_element.is_unlocked = True
-                unlocked_elements.append(unlocked_element)
-                
-                # Calculate experience based on rarity
-                rarity_xp = {
-                    "common": 10,
-                    "uncommon": 25,
-                    "rare": 50,
-                    "legendary": 100
-                }
-                experience_gained += rarity_xp.get(element.rarity, 10)
+        element = _BY_NAME_SLUG.get(request.completed_construction.lower())
+        owned_ids = (
+            frozenset(request.owned_elements) if request.owned_elements is not None else None
+        )
+        if element and _can_unlock_element(element, request.construction_space, owned_ids):
+            unlocked_elements.append({
+                **_ELEMENT_DICT_CACHE[element.id],
+                "discovery_date": datetime.now(),
+                "is_unlocked": True
+            })
+            
+            # Calculate experience based on rarity
+            experience_gained += _RARITY_XP.get(element.rarity, 10)
         
         logger.info(
             "Element unlock attempt",
@@ -274,7 +378,7 @@ async def unlock_element(
         
         return {
             "success": len(unlocked_elements) > 0,
-            "unlocked_elements": [element.dict() for element in unlocked_elements],
+            "unlocked_elements": unlocked_elements,
             "experience_gained": experience_gained,
             "construction_analysis": analysis,
             "message": f"Unlocked {len(unlocked_elements)} new elements!" if unlocked_elements else "No new elements unlocked"
@@ -300,36 +404,47 @@ async def list_elements(
 ):
     """List all collection elements with optional filtering."""
     try:
-        elements = list(COLLECTION_ELEMENTS.values())
-        
-        # Apply filters
         if category:
-            elements = [e for e in elements if e.category == category]
+            category = sys.intern(category)
         if rarity:
-            elements = [e for e in elements if e.rarity == rarity]
-        if unlocked_only:
-            elements = [e for e in elements if e.is_unlocked]
+            rarity = sys.intern(rarity)
         
-        # Group by category and rarity
-        by_category = {}
-        by_rarity = {}
+        # Single filters read a precomputed index; combined filters make one
+        # pass over the parallel attribute columns
+        if bool(category) + bool(rarity) + unlocked_only > 1:
+            elements = [
+                element
+                for element, element_category, element_rarity, element_unlocked in zip(
+                    _ALL_ELEMENTS, _CATEGORY_COLUMN, _RARITY_COLUMN, _UNLOCKED_COLUMN
+                )
+                if (not category or element_category == category)
+                and (not rarity or element_rarity == rarity)
+                and (element_unlocked or not unlocked_only)
+            ]
+        elif category:
+            elements = _BY_CATEGORY.get(category, [])
+        elif rarity:
+            elements = _BY_RARITY.get(rarity, [])
+        elif unlocked_only:
+            elements = _UNLOCKED_ELEMENTS
+        else:
+            elements = _ALL_ELEMENTS
         
-        for element in elements:
-            if element.category not in by_category:
-                by_category[element.category] = []
-            by_category[element.category].append(element)
-            
-            if element.rarity not in by_rarity:
-                by_rarity[element.rarity] = []
-            by_rarity[element.rarity].append(element)
+        if category or rarity or unlocked_only:
+            # Only group sizes are returned, so count instead of grouping
+            category_counts = dict(Counter(e.category for e in elements))
+            rarity_counts = dict(Counter(e.rarity for e in elements))
+        else:
+            category_counts = _COUNTS_BY_CATEGORY
+            rarity_counts = _COUNTS_BY_RARITY
         
         return {
-            "elements": [element.dict() for element in elements],
+            "elements": [_ELEMENT_DICT_CACHE[element.id] for element in elements],
             "total_count": len(elements),
-            "by_category": {k: len(v) for k, v in by_category.items()},
-            "by_rarity": {k: len(v) for k, v in by_rarity.items()},
-            "categories": list(by_category.keys()),
-            "rarities": list(by_rarity.keys())
+            "by_category": category_counts,
+            "by_rarity": rarity_counts,
+            "categories": list(category_counts),
+            "rarities": list(rarity_counts)
         }
         
     except Exception as e:
@@ -353,40 +468,42 @@ async def check_achievements(
     try:
         achievements = []
         
-        # Define achievements
+        # Walk the history once and evaluate each achievement as a plain comparison
+        triangle_hits = sum(1 for h in construction_space.history if "triangle" in str(h).lower())
+        
         achievement_checks = [
-            {
-                "id": "first_construction",
-                "name": "First Steps",
-                "description": "Complete your first geometric construction",
-                "check": lambda: len(construction_space.history) >= 1
-            },
-            {
-                "id": "triangle_master",
-                "name": "Triangle Master", 
-                "description": "Construct 10 different triangles",
-                "check": lambda: len([h for h in construction_space.history if "triangle" in str(h).lower()]) >= 10
-            },
-            {
-                "id": "circle_sage",
-                "name": "Circle Sage",
-                "description": "Master the art of circles with 25 circle constructions",
-                "check": lambda: len(construction_space.circles) >= 25
-            },
-            {
-                "id": "euclid_student",
-                "name": "Student of Euclid",
-                "description": "Complete all propositions from Book I",
-                "check": lambda: False  # Complex check for all Book I propositions
-            }
+            (
+                "first_construction",
+                "First Steps",
+                "Complete your first geometric construction",
+                len(construction_space.history) >= 1
+            ),
+            (
+                "triangle_master",
+                "Triangle Master",
+                "Construct 10 different triangles",
+                triangle_hits >= 10
+            ),
+            (
+                "circle_sage",
+                "Circle Sage",
+                "Master the art of circles with 25 circle constructions",
+                len(construction_space.circles) >= 25
+            ),
+            (
+                "euclid_student",
+                "Student of Euclid",
+                "Complete all propositions from Book I",
+                False  # Complex check for all Book I propositions
+            )
         ]
         
-        for achievement in achievement_checks:
-            if achievement["check"]():
+        for achievement_id, name, description, earned in achievement_checks:
+            if earned:
                 achievements.append({
-                    "id": achievement["id"],
-                    "name": achievement["name"],
-                    "description": achievement["description"],
+                    "id": achievement_id,
+                    "name": name,
+                    "description": description,
                     "unlocked_at": datetime.now()
                 })
         
@@ -409,24 +526,60 @@ async def check_achievements(
             detail=f"Achievement check failed: {str(e)}"
         )
 
-def _can_unlock_element(element: CollectionElement, construction_space: ConstructionSpace) -> bool:
+# Keyed on client-supplied player IDs, so maxsize is what bounds its memory.
+# The cached response is shared between requests and must only be read.
+@lru_cache(maxsize=4096)
+def _build_collection_response(player_id: str, include_locked: bool) -> CollectionStatsResponse:
+    """Build a player's collection response; cached per (player_id, include_locked)."""
+    # In a real app, this would load from database
+    # For now, create a default collection
+    collection = PlayerCollection(
+        player_id=player_id,
+        username=f"Player_{player_id[:8]}"
+    )
+    # Catalog entry is already unlocked and never mutated here
+    collection.add_element(COLLECTION_ELEMENTS["basic_point"])
+    
+    # Get available elements
+    available = list(COLLECTION_ELEMENTS.values()) if include_locked else [
+        e for e in COLLECTION_ELEMENTS.values() if e.is_unlocked or e.id in collection.elements
+    ]
+    
+    # Find next unlockable elements
+    owned_ids = set(collection.elements)
+    next_unlockable = [
+        COLLECTION_ELEMENTS[eid]
+        for eid in _TOPO_ORDER
+        if eid not in owned_ids and _UNLOCK_REQS[eid] <= owned_ids
+    ]
+    
+    return CollectionStatsResponse(
+        collection=collection,
+        available_elements=available,
+        next_unlockable=next_unlockable
+    )
+
+def _can_unlock_element(
+    element: CollectionElement,
+    construction_space: ConstructionSpace,
+    owned_ids: Optional[AbstractSet[str]] = None
+) -> bool:
     """Check if an element can be unlocked based on construction space."""
     
     # Check basic requirements
-    if not element.unlock_requirements:
+    requirements = _UNLOCK_REQS[element.id]
+    if not requirements:
         return True
     
-    # For demo purposes, simple heuristics based on construction content
-    if element.id == "line_segment":
-        return len(construction_space.lines) > 0
-    elif element.id == "circle":
-        return len(construction_space.circles) > 0
-    elif element.id == "equilateral_triangle":
-        return len(construction_space.lines) >= 3 and len(construction_space.circles) >= 2
-    elif element.id == "perpendicular_bisector":
-        return len(construction_space.lines) >= 2 and len(construction_space.circles) >= 2
+    # Missing prerequisites fail before any construction heuristics run
+    if owned_ids is not None and not requirements <= owned_ids:
+        return False
     
-    return False
+    # For demo purposes, simple heuristics based on construction content
+    rule = _UNLOCK_RULES.get(element.id)
+    if rule is None:
+        return False
+    return rule(len(construction_space.lines), len(construction_space.circles))
 
 async def _analyze_construction(
     construction_space: ConstructionSpace, 
@@ -434,28 +587,18 @@ async def _analyze_construction(
 ) -> Dict[str, Any]:
     """Analyze a construction space to identify what was built."""
     
-    analysis = {
-        "point_count": len(construction_space.points),
-        "line_count": len(construction_space.lines),
-        "circle_count": len(construction_space.circles),
+    point_count = len(construction_space.points)
+    line_count = len(construction_space.lines)
+    circle_count = len(construction_space.circles)
+    
+    return {
+        "point_count": point_count,
+        "line_count": line_count,
+        "circle_count": circle_count,
         "construction_steps": len(construction_space.history),
-        "identified_patterns": []
+        # Pattern recognition
+        "identified_patterns": [
+            name for name, matches in _PATTERN_RULES
+            if matches(line_count, circle_count, point_count)
+        ]
     }
-    
-    # Pattern recognition
-    if (analysis["line_count"] == 3 and 
-        analysis["circle_count"] >= 2 and 
-        analysis["point_count"] >= 3):
-        analysis["identified_patterns"].append("equilateral_triangle")
-    
-    if (analysis["line_count"] >= 2 and 
-        analysis["circle_count"] >= 2):
-        analysis["identified_patterns"].append("perpendicular_bisector")
-    
-    if analysis["circle_count"] >= 1:
-        analysis["identified_patterns"].append("circle")
-    
-    if analysis["line_count"] >= 1:
-        analysis["identified_patterns"].append("line_segment")
-    
-    return analysis
\ No newline at end of file
@@ -4,13 +4,19 @@ Construction API endpoints for geometric construction operations.
 Handles construction validation, step recording, and playback functionality.
 """
 
-from typing import Dict, List, Optional, Any
-from fastapi import APIRouter, HTTPException, Depends, status
+from typing import AbstractSet, Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
+import orjson
 import structlog
 
-from app.services.rust_bridge import RustGeometryService, ConstructionSpace
-from app.core.exceptions import ConstructionValidationError
+from app.services.rust_bridge import (
+    RustGeometryService, ConstructionSpace, POINT_LIST_ADAPTER,
+    get_rust_service as get_shared_rust_service
+)
+from app.core.exceptions import ConstructionValidationError, GeometryEngineError
 
 logger = structlog.get_logger()
 router = APIRouter()
@@ -20,9 +26,12 @@ class ConstructionStep(BaseModel):
     step_number: int = Field(..., description="Step number in sequence")
     step_type: str = Field(..., description="Type of construction step")
     description: str = Field(..., description="Human-readable description")
-    dependencies: List[str] = Field(default=[], description="Required object IDs")
-    created_objects: List[str] = Field(default=[], description="Object IDs created by this step")
-    metadata: Dict[str, Any] = Field(default={}, description="Additional step metadata")
+    dependencies: List[str] = Field(default_factory=list, description="Required object IDs")
+    created_objects: List[str] = Field(
+        default_factory=list,
+        description="Names for the objects this step creates; later steps may depend on them"
+    )
+    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional step metadata")
 
 class ConstructionValidationRequest(BaseModel):
     """Request to validate a construction step."""
@@ -36,9 +45,122 @@ class ConstructionSequence(BaseModel):
     steps: List[ConstructionStep] = Field(..., description="Ordered list of construction steps")
     target_theorem: Optional[str] = Field(None, description="Theorem being demonstrated")
 
+# Templates are static, so the response body is serialized once at import
+_TEMPLATES = [
+    {
+        "name": "Equilateral Triangle",
+        "description": "Construct an equilateral triangle on a given line segment",
+        "difficulty": "beginner",
+        "theorem": "Euclid's Proposition I.1",
+        "steps": [
+            {
+                "step_number": 1,
+                "step_type": "given_points",
+                "description": "Given two points A and B",
+                "dependencies": [],
+                "created_objects": ["point_A", "point_B"]
+            },
+            {
+                "step_number": 2, 
+                "step_type": "construct_circle",
+                "description": "Construct circle with center A and radius AB",
+                "dependencies": ["point_A", "point_B"],
+                "created_objects": ["circle_A"]
+            },
+            {
+                "step_number": 3,
+                "step_type": "construct_circle", 
+                "description": "Construct circle with center B and radius BA",
+                "dependencies": ["point_A", "point_B"],
+                "created_objects": ["circle_B"]
+            },
+            {
+                "step_number": 4,
+                "step_type": "find_intersections",
+                "description": "Find intersection of the two circles",
+                "dependencies": ["circle_A", "circle_B"],
+                "created_objects": ["point_C"]
+            },
+            {
+                "step_number": 5,
+                "step_type": "construct_line",
+                "description": "Construct line AC",
+                "dependencies": ["point_A", "point_C"],
+                "created_objects": ["line_AC"]
+            },
+            {
+                "step_number": 6,
+                "step_type": "construct_line",
+                "description": "Construct line BC", 
+                "dependencies": ["point_B", "point_C"],
+                "created_objects": ["line_BC"]
+            }
+        ]
+    },
+    {
+        "name": "Perpendicular Bisector",
+        "description": "Construct the perpendicular bisector of a line segment",
+        "difficulty": "beginner",
+        "theorem": "Standard construction",
+        "steps": [
+            {
+                "step_number": 1,
+                "step_type": "given_points",
+                "description": "Given two points A and B",
+                "dependencies": [],
+                "created_objects": ["point_A", "point_B"]
+            },
+            {
+                "step_number": 2,
+                "step_type": "construct_circle",
+                "description": "Construct circle with center A and radius greater than AB/2",
+                "dependencies": ["point_A", "point_B"],
+                "created_objects": ["circle_A"]
+            },
+            {
+                "step_number": 3,
+                "step_type": "construct_circle",
+                "description": "Construct circle with center B and same radius",
+                "dependencies": ["point_A", "point_B"],
+                "created_objects": ["circle_B"]
+            },
+            {
+                "step_number": 4,
+                "step_type": "find_intersections",
+                "description": "Find intersections of the two circles",
+                "dependencies": ["circle_A", "circle_B"],
+                "created_objects": ["point_C", "point_D"]
+            },
+            {
+                "step_number": 5,
+                "step_type": "construct_line",
+                "description": "Construct line through the intersections",
+                "dependencies": ["point_C", "point_D"],
+                "created_objects": ["line_CD"]
+            }
+        ]
+    }
+]
+
+_TEMPLATES_JSON = orjson.dumps({
+    "templates": _TEMPLATES,
+    "count": len(_TEMPLATES)
+})
+
+# The engine cannot run these steps in a batch yet, so sequences containing
+# them are executed one step at a time
+_PER_STEP_ONLY_TYPES = frozenset({"find_intersections"})
+
+# Exceptions the per-step path raises for each kind of failed batch step, so
+# both paths report the same error messages
+_BATCH_STEP_ERRORS = {
+    "validation": ConstructionValidationError,
+    "geometry": GeometryEngineError,
+}
+
 async def get_rust_service() -> RustGeometryService:
-    """Get the Rust geometry service."""
-    return RustGeometryService()
+    """Get the shared Rust geometry service."""
+    return get_shared_rust_service()
 
 @router.post(
     "/validate-step",
@@ -74,7 +196,9 @@ async def validate_construction_step(
             "is_valid": is_valid,
             "step": request.step,
             "validation_message": "Step is valid" if is_valid else "Step is invalid",
-            "suggestions": _get_validation_suggestions(request.step, request.construction_space) if not is_valid else []
+            "suggestions": _get_validation_suggestions(
+                request.step, request.construction_space.object_ids()
+            ) if not is_valid else []
         }
         
     except Exception as e:
@@ -95,20 +219,30 @@ async def validate_construction_sequence(
     rust_service: RustGeometryService = Depends(get_rust_service)
 ):
     """Validate an entire construction sequence."""
+    _reject_invalid_sequence(sequence, initial_construction_space)
+    
     try:
-        current_space = initial_construction_space.copy(deep=True)
-        validation_results = []
-        
-        for i, step in enumerate(sequence.steps):
-            # Validate each step in sequence
-            step_data = {
+        # Validation is read-only, so the request's space is used as-is
+        current_space = initial_construction_space
+        steps_data = [
+            {
                 "step_type": step.step_type,
                 "dependencies": step.dependencies,
                 "metadata": step.metadata
             }
-            
-            is_valid = await rust_service.validate_construction(current_space, step_data)
-            
+            for step in sequence.steps
+        ]
+        
+        # The whole sequence is validated in one engine call, which stops
+        # at the first invalid step
+        step_validity = await rust_service.validate_sequence(current_space, steps_data)
+        validation_results = []
+        valid_count = 0
+        # The space is not modified while validating, so its object ids are
+        # collected once for every suggestion lookup
+        all_ids = current_space.object_ids()
+        
+        for i, (step, is_valid) in enumerate(zip(sequence.steps, step_validity)):
             validation_result = {
                 "step_number": i + 1,
                 "step": step,
@@ -116,19 +250,17 @@ async def validate_construction_sequence(
                 "validation_message": "Step is valid" if is_valid else "Step is invalid"
             }
             
-            if not is_valid:
-                validation_result["suggestions"] = _get_validation_suggestions(step, current_space)
+            if is_valid:
+                valid_count += 1
+            else:
+                validation_result["suggestions"] = _get_validation_suggestions(step, all_ids)
                 
             validation_results.append(validation_result)
             
-            # If step is invalid, don't continue validation
-            if not is_valid:
-                break
-                
             # TODO: Actually execute the step to update the construction space
             # This would require implementing step execution in the Rust bridge
         
-        overall_valid = all(result["is_valid"] for result in validation_results)
+        overall_valid = valid_count == len(validation_results)
         
         logger.info(
             "Construction sequence validation",
@@ -144,8 +276,8 @@ async def validate_construction_sequence(
             "validation_results": validation_results,
             "summary": {
                 "total_steps": len(sequence.steps),
-                "valid_steps": sum(1 for r in validation_results if r["is_valid"]),
-                "invalid_steps": sum(1 for r in validation_results if not r["is_valid"])
+                "valid_steps": valid_count,
+                "invalid_steps": len(validation_results) - valid_count
             }
         }
         
@@ -159,46 +291,101 @@ async def validate_construction_sequence(
 @router.post(
     "/execute-sequence", 
     summary="Execute Construction Sequence",
-    description="Execute a construction sequence step by step"
+    description=(
+        "Execute a construction sequence step by step. Clients that accept "
+        "application/x-ndjson receive the summary, each step result and the "
+        "final construction space as separate JSON lines."
+    )
 )
 async def execute_construction_sequence(
     sequence: ConstructionSequence,
     initial_construction_space: ConstructionSpace,
+    http_request: Request,
     rust_service: RustGeometryService = Depends(get_rust_service)
 ):
     """Execute a construction sequence step by step."""
+    _reject_invalid_sequence(sequence, initial_construction_space)
+    
     try:
-        current_space = initial_construction_space.copy(deep=True)
+        # The parsed request body is owned by this request; each step rebinds
+        # current_space to the updated space, so no defensive copy is needed
+        current_space = initial_construction_space
         execution_results = []
+        success_count = 0
         
-        for i, step in enumerate(sequence.steps):
-            try:
-                # Execute the step based on its type
-                result = await _execute_construction_step(step, current_space, rust_service)
-                
-                execution_results.append({
-                    "step_number": i + 1,
-                    "step": step,
-                    "success": True,
-                    "result": result,
-                    "message": f"Step {i + 1} executed successfully"
-                })
-                
-                # Update construction space with result
-                if "updated_space" in result:
-                    current_space = result["updated_space"]
-                    
-            except Exception as step_error:
-                execution_results.append({
-                    "step_number": i + 1,
-                    "step": step,
-                    "success": False,
-                    "error": str(step_error),
-                    "message": f"Step {i + 1} failed: {str(step_error)}"
-                })
-                break  # Stop on first failure
+        use_batch = rust_service.supports_batch_execution and not any(
+            step.step_type in _PER_STEP_ONLY_TYPES for step in sequence.steps
+        )
         
-        success_count = sum(1 for r in execution_results if r["success"])
+        if use_batch:
+            # One engine call executes the whole sequence, keeping the space
+            # native between steps instead of re-serializing it per step
+            step_results, current_space = await rust_service.execute_sequence(
+                current_space,
+                [
+                    {
+                        "step_type": step.step_type,
+                        "dependencies": step.dependencies,
+                        "created_objects": step.created_objects,
+                        "metadata": step.metadata
+                    }
+                    for step in sequence.steps
+                ]
+            )
+            
+            for i, (step, step_result) in enumerate(zip(sequence.steps, step_results)):
+                if step_result["success"]:
+                    result = {k: v for k, v in step_result.items() if k != "success"}
+                    success_count += 1
+                    execution_results.append({
+                        "step_number": i + 1,
+                        "step": step,
+                        "success": True,
+                        "result": result,
+                        "message": f"Step {i + 1} executed successfully"
+                    })
+                else:
+                    error = str(_BATCH_STEP_ERRORS[step_result["error_kind"]](step_result["error"]))
+                    execution_results.append({
+                        "step_number": i + 1,
+                        "step": step,
+                        "success": False,
+                        "error": error,
+                        "message": f"Step {i + 1} failed: {error}"
+                    })
+        else:
+            # Names declared in created_objects, mapped to the engine's IDs
+            created_ids: Dict[str, str] = {}
+            for i, step in enumerate(sequence.steps):
+                try:
+                    # Execute the step based on its type
+                    result = await _execute_construction_step(
+                        _resolve_created_ids(step, created_ids), current_space, rust_service
+                    )
+                    
+                    # The space is returned once as final_construction_space,
+                    # so it is not repeated in every step result
+                    current_space = result.pop("updated_space", current_space)
+                    if step.created_objects and "created_id" in result:
+                        created_ids[step.created_objects[0]] = result["created_id"]
+                    success_count += 1
+                    execution_results.append({
+                        "step_number": i + 1,
+                        "step": step,
+                        "success": True,
+                        "result": result,
+                        "message": f"Step {i + 1} executed successfully"
+                    })
+                        
+                except Exception as step_error:
+                    execution_results.append({
+                        "step_number": i + 1,
+                        "step": step,
+                        "success": False,
+                        "error": str(step_error),
+                        "message": f"Step {i + 1} failed: {str(step_error)}"
+                    })
+                    break  # Stop on first failure
         
         logger.info(
             "Construction sequence execution",
@@ -208,16 +395,24 @@ async def execute_construction_sequence(
             overall_success=success_count == len(sequence.steps)
         )
         
+        summary = {
+            "total_steps": len(sequence.steps),
+            "successful_steps": success_count,
+            "failed_steps": len(execution_results) - success_count,
+            "overall_success": success_count == len(sequence.steps)
+        }
+        
+        if "application/x-ndjson" in http_request.headers.get("accept", ""):
+            return StreamingResponse(
+                _stream_sequence_execution(sequence, summary, execution_results, current_space),
+                media_type="application/x-ndjson"
+            )
+        
         return {
             "sequence": sequence,
             "final_construction_space": current_space,
             "execution_results": execution_results,
-            "summary": {
-                "total_steps": len(sequence.steps),
-                "successful_steps": success_count,
-                "failed_steps": len(execution_results) - success_count,
-                "overall_success": success_count == len(sequence.steps)
-            }
+            "summary": summary
         }
         
     except Exception as e:
@@ -234,131 +429,110 @@ async def execute_construction_sequence(
 )
 async def get_construction_templates():
     """Get predefined construction templates."""
-    templates = [
-        {
-            "name": "Equilateral Triangle",
-            "description": "Construct an equilateral triangle on a given line segment",
-            "difficulty": "beginner",
-            "theorem": "Euclid's Proposition I.1",
-            "steps": [
-                {
-                    "step_number": 1,
-                    "step_type": "given_points",
-                    "description": "Given two points A and B",
-                    "dependencies": [],
-                    "created_objects": ["point_A", "point_B"]
-                },
-                {
-                    "step_number": 2, 
-                    "step_type": "construct_circle",
-                    "description": "Construct circle with center A and radius AB",
-                    "dependencies": ["point_A", "point_B"],
-                    "created_objects": ["circle_A"]
-                },
-                {
-                    "step_number": 3,
-                    "step_type": "construct_circle", 
-                    "description": "Construct circle with center B and radius BA",
-                    "dependencies": ["point_A", "point_B"],
-                    "created_objects": ["circle_B"]
-                },
-                {
-                    "step_number": 4,
-                    "step_type": "find_intersections",
-                    "description": "Find intersection of the two circles",
-                    "dependencies": ["circle_A", "circle_B"],
-                    "created_objects": ["point_C"]
-                },
-                {
-                    "step_number": 5,
-                    "step_type": "construct_line",
-                    "description": "Construct line AC",
-                    "dependencies": ["point_A", "point_C"],
-                    "created_objects": ["line_AC"]
-                },
-                {
-                    "step_number": 6,
-                    "step_type": "construct_line",
-                    "description": "Construct line BC", 
-                    "dependencies": ["point_B", "point_C"],
-                    "created_objects": ["line_BC"]
-                }
-            ]
-        },
-        {
-            "name": "Perpendicular Bisector",
-            "description": "Construct the perpendicular bisector of a line segment",
-            "difficulty": "beginner",
-            "theorem": "Standard construction",
-            "steps": [
-                {
-                    "step_number": 1,
-                    "step_type": "given_points",
-                    "description": "Given two points A and B",
-                    "dependencies": [],
-                    "created_objects": ["point_A", "point_B"]
-                },
-                {
-                    "step_number": 2,
-                    "step_type": "construct_circle",
-                    "description": "Construct circle with center A and radius greater than AB/2",
-                    "dependencies": ["point_A", "point_B"],
-                    "created_objects": ["circle_A"]
-                },
-                {
-                    "step_number": 3,
-                    "step_type": "construct_circle",
-                    "description": "Construct circle with center B and same radius",
-                    "dependencies": ["point_A", "point_B"],
-                    "created_objects": ["circle_B"]
-                },
-                {
-                    "step_number": 4,
-                    "step_type": "find_intersections",
-                    "description": "Find intersections of the two circles",
-                    "dependencies": ["circle_A", "circle_B"],
-                    "created_objects": ["point_C", "point_D"]
-                },
-                {
-                    "step_number": 5,
-                    "step_type": "construct_line",
-                    "description": "Construct line through the intersections",
-                    "dependencies": ["point_C", "point_D"],
-                    "created_objects": ["line_CD"]
-                }
-            ]
-        }
-    ]
+    return Response(content=_TEMPLATES_JSON, media_type="application/json")
+
+def _stream_sequence_execution(
+    sequence: ConstructionSequence,
+    summary: Dict[str, Any],
+    execution_results: List[Dict[str, Any]],
+    final_space: ConstructionSpace
+) -> Iterator[bytes]:
+    """Yield a sequence execution as NDJSON, encoding one record at a time."""
+    yield orjson.dumps(
+        jsonable_encoder({"type": "summary", "sequence": sequence, "summary": summary}),
+        option=orjson.OPT_APPEND_NEWLINE
+    )
+    for execution_result in execution_results:
+        yield orjson.dumps(
+            jsonable_encoder({"type": "step", **execution_result}),
+            option=orjson.OPT_APPEND_NEWLINE
+        )
+    yield orjson.dumps(
+        jsonable_encoder({"type": "final_construction_space", "construction_space": final_space}),
+        option=orjson.OPT_APPEND_NEWLINE
+    )
+
+# Steps built from two distinct points, with their arity and identity messages
+_TWO_POINT_STEP_RULES: Dict[str, Tuple[str, str]] = {
+    "construct_line": (
+        "Line construction requires exactly 2 point dependencies",
+        "Cannot construct line with identical points"
+    ),
+    "construct_circle": (
+        "Circle construction requires exactly 2 point dependencies (center and radius point)",
+        "Center and radius point cannot be the same"
+    ),
+}
+
+def _precheck_sequence_dag(
+    steps: List[ConstructionStep],
+    initial_space: ConstructionSpace
+) -> Optional[List[str]]:
+    """Check that every step depends only on objects that already exist.
     
-    return {
-        "templates": templates,
-        "count": len(templates)
-    }
+    Objects come from the initial space or from the created_objects of
+    earlier steps, so dangling and forward (cyclic) references are caught
+    in one pass over the dependencies. Execution resolves a step's first
+    created_objects name to the ID the engine assigns, so later steps may
+    depend on it by that name. Returns the errors, or None.
+    """
+    produced_ids = set(initial_space.object_ids())
+    errors = []
+    
+    for step in steps:
+        for dep_id in step.dependencies:
+            if dep_id not in produced_ids:
+                errors.append(
+                    f"Step {step.step_number} depends on '{dep_id}', which no earlier step "
+                    f"or the initial construction space provides"
+                )
+        produced_ids.update(step.created_objects)
+    
+    return errors or None
 
-def _get_validation_suggestions(step: ConstructionStep, construction_space: ConstructionSpace) -> List[str]:
-    """Get suggestions for fixing invalid construction steps."""
-    suggestions = []
+def _reject_invalid_sequence(sequence: ConstructionSequence, initial_space: ConstructionSpace):
+    """Raise a 422 before any engine call if the sequence is structurally invalid."""
+    errors = _precheck_sequence_dag(sequence.steps, initial_space)
+    if errors:
+        logger.info(
+            "Rejected invalid construction sequence",
+            sequence_name=sequence.name,
+            error_count=len(errors)
+        )
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid construction sequence: {'; '.join(errors)}"
+        )
+
+def _resolve_created_ids(step: ConstructionStep, created_ids: Dict[str, str]) -> ConstructionStep:
+    """Point dependencies on earlier steps' declared names at the engine's IDs."""
+    if not any(dep_id in created_ids for dep_id in step.dependencies):
+        return step
+    return step.model_copy(update={
+        "dependencies": [created_ids.get(dep_id, dep_id) for dep_id in step.dependencies]
+    })
+
+def _get_validation_suggestions(step: ConstructionStep, all_ids: AbstractSet[str]) -> List[str]:
+    """Get suggestions for fixing invalid construction steps.
+    
+    ``all_ids`` holds the ids of every object in the construction space.
+    """
+    # Step-type specific problems are dispositive, so they are reported
+    # without probing the construction space for each dependency
+    pair_rule = _TWO_POINT_STEP_RULES.get(step.step_type)
+    if pair_rule is not None:
+        arity_message, identical_message = pair_rule
+        if len(step.dependencies) != 2:
+            return [arity_message]
+        elif step.dependencies[0] == step.dependencies[1]:
+            return [identical_message]
     
     # Check if dependencies exist
+    suggestions = []
     for dep_id in step.dependencies:
-        if (dep_id not in construction_space.points and 
-            dep_id not in construction_space.lines and 
-            dep_id not in construction_space.circles):
+        if dep_id not in all_ids:
             suggestions.append(f"Required object '{dep_id}' does not exist in construction space")
     
-    # Step-type specific suggestions
-    if step.step_type == "construct_line":
-        if len(step.dependencies) != 2:
-            suggestions.append("Line construction requires exactly 2 point dependencies")
-        elif step.dependencies[0] == step.dependencies[1]:
-            suggestions.append("Cannot construct line with identical points")
-            
-    elif step.step_type == "construct_circle":
-        if len(step.dependencies) != 2:
-            suggestions.append("Circle construction requires exactly 2 point dependencies (center and radius point)")
-        elif step.dependencies[0] == step.dependencies[1]:
-            suggestions.append("Center and radius point cannot be the same")
-    
     return suggestions
 
 async def _execute_construction_step(
@@ -367,72 +541,102 @@ async def _execute_construction_step(
     rust_service: RustGeometryService
 ) -> Dict[str, Any]:
     """Execute a single construction step."""
+    handler = _STEP_HANDLERS.get(step.step_type)
+    if handler is None:
+        raise ConstructionValidationError(f"Unknown step type: {step.step_type}")
+    return await handler(step, construction_space, rust_service)
+
+async def _handle_add_point(
+    step: ConstructionStep,
+    construction_space: ConstructionSpace,
+    rust_service: RustGeometryService
+) -> Dict[str, Any]:
+    """Add a point from the coordinates in the step metadata."""
+    x = step.metadata.get("x", 0.0)
+    y = step.metadata.get("y", 0.0)
+    label = step.metadata.get("label")
     
-    if step.step_type == "add_point":
-        # Extract coordinates from metadata
-        x = step.metadata.get("x", 0.0)
-        y = step.metadata.get("y", 0.0)
-        label = step.metadata.get("label")
-        
-        point_id, updated_space = await rust_service.add_point(
-            construction_space, x, y, label
-        )
-        
-        return {
-            "created_id": point_id,
-            "updated_space": updated_space,
-            "type": "point"
-        }
-        
-    elif step.step_type == "construct_line":
-        if len(step.dependencies) != 2:
-            raise ConstructionValidationError("Line requires exactly 2 points")
-            
-        line_id, updated_space = await rust_service.construct_line(
-            construction_space,
-            step.dependencies[0],
-            step.dependencies[1],
-            step.metadata.get("label")
-        )
-        
-        return {
-            "created_id": line_id,
-            "updated_space": updated_space,
-            "type": "line"
-        }
-        
-    elif step.step_type == "construct_circle":
-        if len(step.dependencies) != 2:
-            raise ConstructionValidationError("Circle requires exactly 2 points")
-            
-        circle_id, updated_space = await rust_service.construct_circle(
-            construction_space,
-            step.dependencies[0],
-            step.dependencies[1], 
-            step.metadata.get("label")
-        )
-        
-        return {
-            "created_id": circle_id,
-            "updated_space": updated_space,
-            "type": "circle"
-        }
+    point_id, updated_space = await rust_service.add_point(
+        construction_space, x, y, label
+    )
+    
+    return {
+        "created_id": point_id,
+        "updated_space": updated_space,
+        "type": "point"
+    }
+
+async def _handle_construct_line(
+    step: ConstructionStep,
+    construction_space: ConstructionSpace,
+    rust_service: RustGeometryService
+) -> Dict[str, Any]:
+    """Construct a line through the two dependency points."""
+    if len(step.dependencies) != 2:
+        raise ConstructionValidationError("Line requires exactly 2 points")
         
-    elif step.step_type == "find_intersections":
-        if len(step.dependencies) != 2:
-            raise ConstructionValidationError("Intersection requires exactly 2 geometric objects")
-            
-        intersections, updated_space = await rust_service.find_intersections(
-            construction_space,
-            step.dependencies[0],
-            step.dependencies[1]
-        )
+    line_id, updated_space = await rust_service.construct_line(
+        construction_space,
+        step.dependencies[0],
+        step.dependencies[1],
+        step.metadata.get("label")
+    )
+    
+    return {
+        "created_id": line_id,
+        "updated_space": updated_space,
+        "type": "line"
+    }
+
+async def _handle_construct_circle(
+    step: ConstructionStep,
+    construction_space: ConstructionSpace,
+    rust_service: RustGeometryService
+) -> Dict[str, Any]:
+    """Construct a circle from its center and radius dependency points."""
+    if len(step.dependencies) != 2:
+        raise ConstructionValidationError("Circle requires exactly 2 points")
         
-        return {
-            "intersections": [point.dict() for point in intersections],
-            "updated_space": updated_space,
-            "type": "intersections"
-        }
+    circle_id, updated_space = await rust_service.construct_circle(
+        construction_space,
+        step.dependencies[0],
+        step.dependencies[1], 
+        step.metadata.get("label")
+    )
+    
+    return {
+        "created_id": circle_id,
+        "updated_space": updated_space,
+        "type": "circle"
+    }
+
+async def _handle_find_intersections(
+    step: ConstructionStep,
+    construction_space: ConstructionSpace,
+    rust_service: RustGeometryService
+) -> Dict[str, Any]:
+    """Find the intersections of the two dependency objects."""
+    if len(step.dependencies) != 2:
+        raise ConstructionValidationError("Intersection requires exactly 2 geometric objects")
         
-    else:
-        raise ConstructionValidationError(f"Unknown step type: {step.step_type}")
\ No newline at end of file
+    intersections, updated_space = await rust_service.find_intersections(
+        construction_space,
+        step.dependencies[0],
+        step.dependencies[1]
+    )
+    
+    return {
+        "intersections": POINT_LIST_ADAPTER.dump_python(intersections),
+        "updated_space": updated_space,
+        "type": "intersections"
+    }
+
+_STEP_HANDLERS: Dict[
+    str,
+    Callable[[ConstructionStep, ConstructionSpace, RustGeometryService], Awaitable[Dict[str, Any]]]
+] = {
+    "add_point": _handle_add_point,
+    "construct_line": _handle_construct_line,
+    "construct_circle": _handle_construct_circle,
+    "find_intersections": _handle_find_intersections,
+}
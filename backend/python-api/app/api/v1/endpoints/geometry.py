@@ -5,17 +5,24 @@ Handles points, lines, circles, and fundamental geometric calculations
 through the Rust geometry engine.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 import structlog
 
-from app.services.rust_bridge import RustGeometryService, ConstructionSpace, Point, Line, Circle
+from app.services.rust_bridge import (
+    RustGeometryService, ConstructionSpace, Point, Line, Circle, POINT_LIST_ADAPTER,
+    get_rust_service as get_shared_rust_service
+)
+from app.core.config import get_settings
+from app.services.space_store import ConstructionSpaceStore, get_space_store
 from app.core.exceptions import GeometryEngineError
 
 logger = structlog.get_logger()
+settings = get_settings()
 router = APIRouter()
 
 # Pydantic models for API requests/responses
@@ -53,12 +60,80 @@ class ConstructionSpaceResponse(BaseModel):
     construction_space: ConstructionSpace
     operation: str
     created_id: Optional[str] = None
+    space_id: Optional[str] = None
+
+class StoredSpaceObjectResponse(BaseModel):
+    """Response model for adding an object to a stored construction space."""
+    space_id: str
+    operation: str
+    created_id: str
+    created: Dict[str, Any]
+
+def _construction_space_response(
+    construction_space: ConstructionSpace,
+    operation: str,
+    created_id: Optional[str] = None,
+    space_id: Optional[str] = None
+):
+    """Build the response for an operation that returns a construction space.
+    
+    The space was produced by the geometry engine, so it is serialized
+    directly rather than validated again against ConstructionSpaceResponse,
+    unless response validation is enabled for debugging.
+    """
+    if settings.validate_api_response:
+        return ConstructionSpaceResponse(
+            construction_space=construction_space,
+            operation=operation,
+            created_id=created_id,
+            space_id=space_id
+        )
+    
+    return ORJSONResponse({
+        "construction_space": construction_space.model_dump(),
+        "operation": operation,
+        "created_id": created_id,
+        "space_id": space_id
+    })
+
+def _space_not_found(space_id: str) -> HTTPException:
+    """Build the 404 raised for unknown or expired stored spaces."""
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Construction space not found: {space_id}"
+    )
+
+async def _apply_to_stored_space(
+    store: ConstructionSpaceStore,
+    space_id: str,
+    apply: Callable[[ConstructionSpace], Awaitable[Tuple[str, ConstructionSpace]]]
+) -> Tuple[str, ConstructionSpace]:
+    """Run an operation against a stored space and store the updated space.
+    
+    Updates to one space are serialized, so concurrent requests cannot
+    overwrite each other's objects.
+    """
+    lock = store.lock(space_id)
+    if lock is None:
+        raise _space_not_found(space_id)
+    
+    async with lock:
+        space = store.get(space_id)
+        if space is None:
+            raise _space_not_found(space_id)
+        created_id, updated_space = await apply(space)
+        try:
+            store.put(space_id, updated_space)
+        except KeyError:
+            # Evicted or deleted while the engine was running
+            raise _space_not_found(space_id)
+    
+    return created_id, updated_space
 
 # Dependency to get Rust service
 async def get_rust_service() -> RustGeometryService:
-    """Get the Rust geometry service."""
-    # In a real app, this would be injected from app state
-    return RustGeometryService()
+    """Get the shared Rust geometry service."""
+    return get_shared_rust_service()
 
 @router.get(
     "/health",
@@ -91,17 +166,22 @@ async def geometry_health_check(
     description="Create a new empty geometric construction space"
 )
 async def create_construction_space(
-    rust_service: RustGeometryService = Depends(get_rust_service)
+    rust_service: RustGeometryService = Depends(get_rust_service),
+    store: ConstructionSpaceStore = Depends(get_space_store)
 ):
-    """Create a new construction space."""
+    """Create a new construction space.
+    
+    The space is also kept on the server under the returned ``space_id``,
+    so it can be extended through the ``/spaces/{space_id}`` endpoints.
+    """
     try:
         construction_space = await rust_service.create_construction_space()
+        space_id = store.create(construction_space)
         
-        logger.info("Created new construction space")
+        logger.info("Created new construction space", space_id=space_id)
         
-        return ConstructionSpaceResponse(
-            construction_space=construction_space,
-            operation="create_construction_space"
+        return _construction_space_response(
+            construction_space, "create_construction_space", space_id=space_id
         )
     except Exception as e:
         logger.error("Failed to create construction space", error=str(e))
@@ -138,11 +218,7 @@ async def add_point(
             label=point_data.label
         )
         
-        return ConstructionSpaceResponse(
-            construction_space=updated_space,
-            operation="add_point",
-            created_id=point_id
-        )
+        return _construction_space_response(updated_space, "add_point", point_id)
     except GeometryEngineError as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -183,11 +259,7 @@ async def construct_line(
             label=line_data.label
         )
         
-        return ConstructionSpaceResponse(
-            construction_space=updated_space,
-            operation="construct_line",
-            created_id=line_id
-        )
+        return _construction_space_response(updated_space, "construct_line", line_id)
     except GeometryEngineError as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -228,11 +300,7 @@ async def construct_circle(
             label=circle_data.label
         )
         
-        return ConstructionSpaceResponse(
-            construction_space=updated_space,
-            operation="construct_circle",
-            created_id=circle_id
-        )
+        return _construction_space_response(updated_space, "construct_circle", circle_id)
     except GeometryEngineError as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -273,7 +341,7 @@ async def find_intersections(
         
         return {
             "construction_space": updated_space,
-            "intersections": [point.dict() for point in intersections],
+            "intersections": POINT_LIST_ADAPTER.dump_python(intersections),
             "intersection_count": len(intersections),
             "operation": "find_intersections"
         }
@@ -324,4 +392,173 @@ async def get_construction_summary(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get construction summary: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+@router.get(
+    "/spaces/{space_id}",
+    response_model=ConstructionSpaceResponse,
+    summary="Get Stored Construction Space",
+    description="Get a construction space kept on the server"
+)
+async def get_stored_construction_space(
+    space_id: str,
+    store: ConstructionSpaceStore = Depends(get_space_store)
+):
+    """Get a stored construction space."""
+    construction_space = store.get(space_id)
+    if construction_space is None:
+        raise _space_not_found(space_id)
+    
+    return _construction_space_response(
+        construction_space, "get_construction_space", space_id=space_id
+    )
+
+@router.delete(
+    "/spaces/{space_id}",
+    response_model=GeometryResponse,
+    summary="Delete Stored Construction Space",
+    description="Discard a construction space kept on the server"
+)
+async def delete_stored_construction_space(
+    space_id: str,
+    store: ConstructionSpaceStore = Depends(get_space_store)
+):
+    """Delete a stored construction space."""
+    if not store.delete(space_id):
+        raise _space_not_found(space_id)
+    
+    return GeometryResponse(
+        success=True,
+        message="Construction space deleted",
+        data={"space_id": space_id}
+    )
+
+@router.post(
+    "/spaces/{space_id}/points",
+    response_model=StoredSpaceObjectResponse,
+    summary="Add Point to Stored Space",
+    description="Add a point to a stored construction space and return only the new point"
+)
+async def add_point_to_stored_space(
+    space_id: str,
+    point_data: PointCreate,
+    rust_service: RustGeometryService = Depends(get_rust_service),
+    store: ConstructionSpaceStore = Depends(get_space_store)
+):
+    """Add a point to a stored construction space."""
+    try:
+        point_id, updated_space = await _apply_to_stored_space(
+            store,
+            space_id,
+            lambda space: rust_service.add_point(space, point_data.x, point_data.y, point_data.label)
+        )
+        
+        logger.info("Added point to stored construction space", space_id=space_id, point_id=point_id)
+        
+        return {
+            "space_id": space_id,
+            "operation": "add_point",
+            "created_id": point_id,
+            "created": updated_space.points[point_id].model_dump()
+        }
+    except HTTPException:
+        raise
+    except GeometryEngineError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error("Failed to add point to stored space", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to add point: {str(e)}"
+        )
+
+@router.post(
+    "/spaces/{space_id}/lines",
+    response_model=StoredSpaceObjectResponse,
+    summary="Construct Line in Stored Space",
+    description="Construct a line in a stored construction space and return only the new line"
+)
+async def construct_line_in_stored_space(
+    space_id: str,
+    line_data: LineCreate,
+    rust_service: RustGeometryService = Depends(get_rust_service),
+    store: ConstructionSpaceStore = Depends(get_space_store)
+):
+    """Construct a line in a stored construction space."""
+    try:
+        line_id, updated_space = await _apply_to_stored_space(
+            store,
+            space_id,
+            lambda space: rust_service.construct_line(
+                space, line_data.point1_id, line_data.point2_id, line_data.label
+            )
+        )
+        
+        logger.info("Constructed line in stored construction space", space_id=space_id, line_id=line_id)
+        
+        return {
+            "space_id": space_id,
+            "operation": "construct_line",
+            "created_id": line_id,
+            "created": updated_space.lines[line_id].model_dump()
+        }
+    except HTTPException:
+        raise
+    except GeometryEngineError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error("Failed to construct line in stored space", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to construct line: {str(e)}"
+        )
+
+@router.post(
+    "/spaces/{space_id}/circles",
+    response_model=StoredSpaceObjectResponse,
+    summary="Construct Circle in Stored Space",
+    description="Construct a circle in a stored construction space and return only the new circle"
+)
+async def construct_circle_in_stored_space(
+    space_id: str,
+    circle_data: CircleCreate,
+    rust_service: RustGeometryService = Depends(get_rust_service),
+    store: ConstructionSpaceStore = Depends(get_space_store)
+):
+    """Construct a circle in a stored construction space."""
+    try:
+        circle_id, updated_space = await _apply_to_stored_space(
+            store,
+            space_id,
+            lambda space: rust_service.construct_circle(
+                space, circle_data.center_id, circle_data.radius_point_id, circle_data.label
+            )
+        )
+        
+        logger.info("Constructed circle in stored construction space", space_id=space_id, circle_id=circle_id)
+        
+        return {
+            "space_id": space_id,
+            "operation": "construct_circle",
+            "created_id": circle_id,
+            "created": updated_space.circles[circle_id].model_dump()
+        }
+    except HTTPException:
+        raise
+    except GeometryEngineError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error("Failed to construct circle in stored space", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to construct circle: {str(e)}"
+        )
@@ -5,20 +5,48 @@ Provides endpoints for creating, querying, and analyzing geometric
 relationships stored in the Neo4j graph database.
 """
 
-from typing import Dict, List, Optional, Any
+import itertools
+import re
+import time
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Optional, Any
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from neo4j import READ_ACCESS
 from pydantic import BaseModel, Field
+import orjson
 import structlog
 
-from app.services.neo4j_service import get_neo4j_service, Neo4jService
+from app.core.config import get_settings
+from app.services.neo4j_service import (
+    get_neo4j_service, Neo4jService, node_projection, project_node, project_nodes, projection_fields
+)
+from app.services.graph_cache import TTLCache, get_graph_cache
 from app.models.graph import (
     GeometricPoint, GeometricLine, GeometricCircle, Construction,
-    GraphQuery, GraphResult, NodeType, RelationshipType
+    GraphQuery, GraphResult, NodeType, RelationshipType, CypherQueries
 )
 
 logger = structlog.get_logger()
-router = APIRouter()
+settings = get_settings()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Custom queries must start with a read clause (or a db.* catalog procedure)
+# and may not contain a write clause or any other procedure call anywhere.
+_READ_ONLY_QUERY = re.compile(r"\s*(?:MATCH|OPTIONAL|RETURN|WITH|UNWIND|CALL\s+db\.)\b", re.IGNORECASE)
+_WRITE_CLAUSE = re.compile(
+    r"\b(?:CREATE|MERGE|DELETE|SET|REMOVE|DROP|FOREACH|LOAD\s+CSV)\b|\bCALL\s+(?!db\.)",
+    re.IGNORECASE
+)
+
+# Tie-breaker for point IDs generated within the same nanosecond
+_point_id_counter = itertools.count()
+
+
+def _new_point_id() -> str:
+    """Generate a time-ordered, collision-free default point ID."""
+    return f"point_{time.time_ns():x}{next(_point_id_counter) & 0xffff:04x}"
 
 
 class GraphNodeCreate(BaseModel):
@@ -36,6 +64,20 @@ class GraphRelationshipCreate(BaseModel):
     properties: Dict[str, Any] = Field(default={})
 
 
+class GraphPointCreate(BaseModel):
+    """A point to create in the graph."""
+    node_id: Optional[str] = None
+    x: float
+    y: float
+    label: Optional[str] = None
+    is_constructed: bool = False
+
+
+class GraphPointsBulkCreate(BaseModel):
+    """Request to create many graph points at once."""
+    points: List[GraphPointCreate] = Field(..., min_length=1, max_length=10000)
+
+
 class GraphAnalysisRequest(BaseModel):
     """Request for graph analysis."""
     analysis_type: str = Field(..., description="Type of analysis to perform")
@@ -52,15 +94,8 @@ async def graph_health_check(
     neo4j_service: Neo4jService = Depends(get_neo4j_service)
 ):
     """Check graph database health."""
-    try:
-        health = await neo4j_service.health_check()
-        return health
-    except Exception as e:
-        logger.error("Graph health check failed", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=f"Graph database health check failed: {str(e)}"
-        )
+    health = await neo4j_service.health_check()
+    return health
 
 
 @router.post(
@@ -74,30 +109,24 @@ async def execute_graph_query(
     neo4j_service: Neo4jService = Depends(get_neo4j_service)
 ):
     """Execute a custom graph query."""
-    try:
-        # Security: Only allow read queries for safety
-        if not query.cypher.strip().upper().startswith(('MATCH', 'RETURN', 'WITH', 'OPTIONAL')):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Only read queries (MATCH, RETURN, WITH, OPTIONAL) are allowed"
-            )
-        
-        result = await neo4j_service.execute_query(query)
-        logger.info(
-            "Graph query executed",
-            records_returned=len(result.records),
-            execution_time=result.execution_time
-        )
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Graph query execution failed", error=str(e))
+    # Security: Only allow read queries for safety
+    if not _READ_ONLY_QUERY.match(query.cypher) or _WRITE_CLAUSE.search(query.cypher):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Query execution failed: {str(e)}"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only read queries (MATCH, OPTIONAL, RETURN, WITH, UNWIND, CALL db.*) are allowed"
         )
+    
+    result = await neo4j_service.execute_query(query, access_mode=READ_ACCESS)
+    logger.info(
+        "Graph query executed",
+        records_returned=len(result.records),
+        execution_time=result.execution_time
+    )
+    
+    # Records are already plain values; skip re-validating them
+    if settings.validate_api_response:
+        return result
+    return ORJSONResponse(result.model_dump())
 
 
 @router.post(
@@ -107,33 +136,54 @@ async def execute_graph_query(
 )
 async def create_graph_point(
     point_data: Dict[str, Any],
-    neo4j_service: Neo4jService = Depends(get_neo4j_service)
+    neo4j_service: Neo4jService = Depends(get_neo4j_service),
+    cache: TTLCache = Depends(get_graph_cache)
 ):
     """Create a point in the graph database."""
-    try:
-        point = GeometricPoint(
-            node_id=point_data.get("node_id", f"point_{int(datetime.now().timestamp())}"),
-            x=point_data["x"],
-            y=point_data["y"],
-            label=point_data.get("label"),
-            is_constructed=point_data.get("is_constructed", False)
-        )
-        
-        result = await neo4j_service.create_point(point)
-        logger.info("Graph point created", point_id=point.node_id)
-        
-        return {
-            "success": True,
-            "point": point.dict(),
-            "graph_result": result.dict()
-        }
-        
-    except Exception as e:
-        logger.error("Graph point creation failed", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create graph point: {str(e)}"
-        )
+    point = GeometricPoint(
+        node_id=point_data.get("node_id") or _new_point_id(),
+        x=point_data["x"],
+        y=point_data["y"],
+        label=point_data.get("label"),
+        is_constructed=point_data.get("is_constructed", False)
+    )
+    
+    result = await neo4j_service.create_point(point)
+    cache.invalidate("graph_stats")
+    logger.info("Graph point created", point_id=point.node_id)
+    
+    return {
+        "success": True,
+        "point": point.model_dump(mode="json"),
+        "graph_result": result.model_dump(mode="json")
+    }
+
+
+@router.post(
+    "/points/bulk",
+    summary="Create Graph Points in Bulk",
+    description="Create many geometric points in the graph database in one query"
+)
+async def create_graph_points_bulk(
+    request: GraphPointsBulkCreate,
+    neo4j_service: Neo4jService = Depends(get_neo4j_service),
+    cache: TTLCache = Depends(get_graph_cache)
+):
+    """Create many points in the graph database."""
+    points = [point.model_dump() for point in request.points]
+    for point in points:
+        if point["node_id"] is None:
+            point["node_id"] = _new_point_id()
+    
+    node_ids = await neo4j_service.create_points(points)
+    cache.invalidate("graph_stats")
+    logger.info("Graph points created", count=len(node_ids))
+    
+    return {
+        "success": True,
+        "node_ids": node_ids,
+        "count": len(node_ids)
+    }
 
 
 @router.post(
@@ -144,35 +194,36 @@ async def create_graph_point(
 async def create_construction_relationships(
     construction_id: str,
     object_ids: List[str],
-    relationship_type: str = "CREATED_BY",
-    neo4j_service: Neo4jService = Depends(get_neo4j_service)
+    relationship_type: RelationshipType = RelationshipType.CREATED_BY,
+    neo4j_service: Neo4jService = Depends(get_neo4j_service),
+    cache: TTLCache = Depends(get_graph_cache)
 ):
     """Create relationships between construction and geometric objects."""
-    try:
-        await neo4j_service.link_construction_objects(
-            construction_id, object_ids, relationship_type
-        )
-        
-        logger.info(
-            "Construction relationships created",
-            construction_id=construction_id,
-            object_count=len(object_ids),
-            relationship_type=relationship_type
-        )
-        
-        return {
-            "success": True,
-            "construction_id": construction_id,
-            "objects_linked": len(object_ids),
-            "relationship_type": relationship_type
-        }
-        
-    except Exception as e:
-        logger.error("Construction relationship creation failed", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create construction relationships: {str(e)}"
-        )
+    await neo4j_service.link_construction_objects(
+        construction_id, object_ids, relationship_type.value
+    )
+    
+    # The construction's cached graph is stale now, and since its embedding
+    # changed it may rank differently in any other construction's results.
+    # The owning player is not known here, so every player graph is dropped.
+    cache.invalidate("construction_graph", construction_id)
+    cache.invalidate("similar_constructions")
+    cache.invalidate("player_graph")
+    cache.invalidate("graph_stats")
+    
+    logger.info(
+        "Construction relationships created",
+        construction_id=construction_id,
+        object_count=len(object_ids),
+        relationship_type=relationship_type.value
+    )
+    
+    return {
+        "success": True,
+        "construction_id": construction_id,
+        "objects_linked": len(object_ids),
+        "relationship_type": relationship_type.value
+    }
 
 
 @router.get(
@@ -182,29 +233,28 @@ async def create_construction_relationships(
 )
 async def get_construction_graph(
     construction_id: str,
-    neo4j_service: Neo4jService = Depends(get_neo4j_service)
+    fields: Optional[List[str]] = Query(None, description="Node properties to return"),
+    neo4j_service: Neo4jService = Depends(get_neo4j_service),
+    cache: TTLCache = Depends(get_graph_cache)
 ):
     """Get the complete graph structure for a construction."""
-    try:
-        graph_data = await neo4j_service.get_construction_graph(construction_id)
-        
-        if not graph_data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Construction {construction_id} not found in graph"
-            )
-        
-        logger.info("Construction graph retrieved", construction_id=construction_id)
-        return graph_data
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Construction graph retrieval failed", error=str(e))
+    fields = projection_fields(fields)
+    cache_key = ("construction_graph", construction_id, tuple(fields))
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
+    graph_data = await neo4j_service.get_construction_graph(construction_id, fields)
+    
+    if not graph_data:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve construction graph: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Construction {construction_id} not found in graph"
         )
+    
+    logger.info("Construction graph retrieved", construction_id=construction_id)
+    cache.set(cache_key, graph_data)
+    return ORJSONResponse(graph_data)
 
 
 @router.get(
@@ -215,30 +265,30 @@ async def get_construction_graph(
 async def find_similar_constructions(
     construction_id: str,
     limit: int = 10,
-    neo4j_service: Neo4jService = Depends(get_neo4j_service)
+    neo4j_service: Neo4jService = Depends(get_neo4j_service),
+    cache: TTLCache = Depends(get_graph_cache)
 ):
     """Find constructions similar to the given one."""
-    try:
-        similar = await neo4j_service.find_similar_constructions(construction_id, limit)
-        
-        logger.info(
-            "Similar constructions found",
-            construction_id=construction_id,
-            similar_count=len(similar)
-        )
-        
-        return {
-            "construction_id": construction_id,
-            "similar_constructions": similar,
-            "count": len(similar)
-        }
-        
-    except Exception as e:
-        logger.error("Similar construction search failed", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to find similar constructions: {str(e)}"
-        )
+    cache_key = ("similar_constructions", construction_id, limit)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
+    similar = await neo4j_service.find_similar_constructions(construction_id, limit)
+    
+    logger.info(
+        "Similar constructions found",
+        construction_id=construction_id,
+        similar_count=len(similar)
+    )
+    
+    response = {
+        "construction_id": construction_id,
+        "similar_constructions": similar,
+        "count": len(similar)
+    }
+    cache.set(cache_key, response)
+    return ORJSONResponse(response)
 
 
 @router.post(
@@ -251,85 +301,119 @@ async def analyze_graph_patterns(
     neo4j_service: Neo4jService = Depends(get_neo4j_service)
 ):
     """Perform graph pattern analysis."""
-    try:
-        if analysis_request.analysis_type == "construction_patterns":
-            player_id = analysis_request.parameters.get("player_id")
-            result = await neo4j_service.analyze_construction_patterns(player_id)
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Unknown analysis type: {analysis_request.analysis_type}"
-            )
-        
-        logger.info(
-            "Graph analysis completed",
-            analysis_type=analysis_request.analysis_type,
-            patterns_found=len(result.get("patterns", []))
-        )
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Graph analysis failed", error=str(e))
+    if analysis_request.analysis_type == "construction_patterns":
+        player_id = analysis_request.parameters.get("player_id")
+        result = await neo4j_service.analyze_construction_patterns(player_id)
+    else:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Graph analysis failed: {str(e)}"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown analysis type: {analysis_request.analysis_type}"
         )
+    
+    logger.info(
+        "Graph analysis completed",
+        analysis_type=analysis_request.analysis_type,
+        patterns_found=len(result.get("patterns", []))
+    )
+    
+    return result
 
 
 @router.get(
     "/objects/{object_id}/relationships",
     summary="Get Object Relationships",
-    description="Get all relationships for a geometric object"
+    description=(
+        "Get all relationships for a geometric object. Clients that accept "
+        "application/x-ndjson receive one relationship per line as the "
+        "database returns them."
+    )
 )
 async def get_object_relationships(
     object_id: str,
-    relationship_types: Optional[List[str]] = None,
+    http_request: Request,
+    relationship_types: Optional[List[str]] = Query(None),
+    fields: Optional[List[str]] = Query(None, description="Related node properties to return"),
     neo4j_service: Neo4jService = Depends(get_neo4j_service)
 ):
     """Get all relationships for a geometric object."""
-    try:
-        # Build dynamic query based on relationship types filter
-        relationship_filter = ""
-        if relationship_types:
-            relationship_filter = f":{':'.join(relationship_types)}"
-        
-        query = GraphQuery(
-            cypher=f"""
-                MATCH (obj:GeometricObject {{node_id: $object_id}})-[r{relationship_filter}]-(related)
-                RETURN 
-                    type(r) as relationship_type,
-                    related.node_id as related_id,
-                    labels(related) as related_labels,
-                    r as relationship_properties,
-                    related as related_object
-                ORDER BY type(r), related.created_at
-            """,
-            parameters={"object_id": object_id}
-        )
-        
-        result = await neo4j_service.execute_query(query)
-        
-        logger.info(
-            "Object relationships retrieved",
-            object_id=object_id,
-            relationships_count=len(result.records)
-        )
-        
-        return {
-            "object_id": object_id,
-            "relationships": result.records,
-            "count": len(result.records)
-        }
-        
-    except Exception as e:
-        logger.error("Object relationships retrieval failed", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve object relationships: {str(e)}"
+    fields = projection_fields(fields)
+    query = GraphQuery(
+        cypher=CypherQueries.GET_OBJECT_RELATIONSHIPS,
+        parameters={"object_id": object_id, "types": relationship_types or [], "fields": fields}
+    )
+    
+    if "application/x-ndjson" in http_request.headers.get("accept", ""):
+        return StreamingResponse(
+            _stream_relationships(neo4j_service.stream_query(query), fields),
+            media_type="application/x-ndjson"
         )
+    
+    result = await neo4j_service.execute_query(query, access_mode=READ_ACCESS)
+    if fields:
+        for record in result.records:
+            record["related_object"] = project_node(record["related_object"], fields)
+    
+    logger.info(
+        "Object relationships retrieved",
+        object_id=object_id,
+        relationships_count=len(result.records)
+    )
+    
+    return ORJSONResponse({
+        "object_id": object_id,
+        "relationships": result.records,
+        "count": len(result.records)
+    })
+
+
+async def _stream_relationships(
+    records: AsyncIterator[Dict[str, Any]],
+    fields: List[str]
+) -> AsyncIterator[bytes]:
+    """Yield relationship records as NDJSON, encoding one record at a time."""
+    async for record in records:
+        if fields:
+            record["related_object"] = project_node(record["related_object"], fields)
+        yield orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+
+
+@lru_cache(maxsize=None)
+def _player_graph_cypher(include_elements: bool, include_constructions: bool) -> str:
+    """Build the player graph query for a combination of sections.
+    
+    Only four variants exist, so each is built once and reused.
+    """
+    # Build query based on what to include. Each section is collected
+    # in its own subquery so elements and constructions are never
+    # multiplied against each other before being collected.
+    subqueries = []
+    return_clauses = [f"{node_projection('p')} as p"]
+    
+    if include_elements:
+        subqueries.append(f"""
+            CALL {{
+                WITH p
+                OPTIONAL MATCH (p)-[:OWNS]->(e:Element)
+                RETURN collect(DISTINCT {node_projection("e")}) as elements
+            }}""")
+        return_clauses.append("elements")
+    
+    if include_constructions:
+        subqueries.append(f"""
+            CALL {{
+                WITH p
+                OPTIONAL MATCH (p)<-[:CREATED_BY]-(c:Construction)
+                OPTIONAL MATCH (c)-[:CREATED_BY|DEPENDS_ON]-(obj:GeometricObject)
+                RETURN collect(DISTINCT {node_projection("c")}) as constructions,
+                       collect(DISTINCT {node_projection("obj")}) as geometric_objects
+            }}""")
+        return_clauses.extend(["constructions", "geometric_objects"])
+    
+    return f"""
+            MATCH (p:Player {{node_id: $player_id}})
+            {"".join(subqueries)}
+            RETURN {', '.join(return_clauses)}
+        """
 
 
 @router.get(
@@ -341,68 +425,48 @@ async def get_player_graph(
     player_id: str,
     include_elements: bool = True,
     include_constructions: bool = True,
-    neo4j_service: Neo4jService = Depends(get_neo4j_service)
+    fields: Optional[List[str]] = Query(None, description="Node properties to return"),
+    neo4j_service: Neo4jService = Depends(get_neo4j_service),
+    cache: TTLCache = Depends(get_graph_cache)
 ):
     """Get player's complete graph including constructions and elements."""
-    try:
-        # Build query based on what to include
-        optional_clauses = []
-        return_clauses = ["p"]
-        
-        if include_elements:
-            optional_clauses.append("OPTIONAL MATCH (p)-[:OWNS]->(e:Element)")
-            return_clauses.append("collect(DISTINCT e) as elements")
-        
-        if include_constructions:
-            optional_clauses.append("OPTIONAL MATCH (p)<-[:CREATED_BY]-(c:Construction)")
-            optional_clauses.append("OPTIONAL MATCH (c)-[:CREATED_BY|DEPENDS_ON]-(obj:GeometricObject)")
-            return_clauses.extend([
-                "collect(DISTINCT c) as constructions",
-                "collect(DISTINCT obj) as geometric_objects"
-            ])
-        
-        query = GraphQuery(
-            cypher=f"""
-                MATCH (p:Player {{node_id: $player_id}})
-                {chr(10).join(optional_clauses)}
-                RETURN {', '.join(return_clauses)}
-            """,
-            parameters={"player_id": player_id}
-        )
-        
-        result = await neo4j_service.execute_query(query)
-        
-        if not result.records:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Player {player_id} not found in graph"
-            )
-        
-        player_data = result.records[0]
-        
-        logger.info(
-            "Player graph retrieved",
-            player_id=player_id,
-            elements=len(player_data.get("elements", [])),
-            constructions=len(player_data.get("constructions", []))
-        )
-        
-        return {
-            "player_id": player_id,
-            "player": player_data.get("p", {}),
-            "elements": player_data.get("elements", []),
-            "constructions": player_data.get("constructions", []),
-            "geometric_objects": player_data.get("geometric_objects", [])
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Player graph retrieval failed", error=str(e))
+    fields = projection_fields(fields)
+    cache_key = ("player_graph", player_id, include_elements, include_constructions, tuple(fields))
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
+    query = GraphQuery(
+        cypher=_player_graph_cypher(include_elements, include_constructions),
+        parameters={"player_id": player_id, "fields": fields}
+    )
+    
+    result = await neo4j_service.execute_query(query, access_mode=READ_ACCESS)
+    
+    if not result.records:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve player graph: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Player {player_id} not found in graph"
         )
+    
+    player_data = result.records[0]
+    
+    logger.info(
+        "Player graph retrieved",
+        player_id=player_id,
+        elements=len(player_data.get("elements", [])),
+        constructions=len(player_data.get("constructions", []))
+    )
+    
+    response = {
+        "player_id": player_id,
+        "player": project_node(player_data.get("p", {}), fields),
+        "elements": project_nodes(player_data.get("elements", []), fields),
+        "constructions": project_nodes(player_data.get("constructions", []), fields),
+        "geometric_objects": project_nodes(player_data.get("geometric_objects", []), fields)
+    }
+    cache.set(cache_key, response)
+    return ORJSONResponse(response)
 
 
 @router.get(
@@ -411,58 +475,56 @@ async def get_player_graph(
     description="Get statistics about the graph database contents"
 )
 async def get_graph_statistics(
-    neo4j_service: Neo4jService = Depends(get_neo4j_service)
+    neo4j_service: Neo4jService = Depends(get_neo4j_service),
+    cache: TTLCache = Depends(get_graph_cache)
 ):
     """Get graph database statistics."""
-    try:
-        query = GraphQuery(
-            cypher="""
-                MATCH (n)
-                WITH labels(n) as nodeLabels
-                UNWIND nodeLabels as label
-                RETURN label, count(*) as count
-                ORDER BY count DESC
-                
-                UNION ALL
-                
-                MATCH ()-[r]->()
-                WITH type(r) as relType
-                RETURN relType as label, count(*) as count
-                ORDER BY count DESC
-            """
-        )
-        
-        result = await neo4j_service.execute_query(query)
-        
-        # Separate nodes and relationships
-        nodes = []
-        relationships = []
-        
-        for record in result.records:
-            label = record.get("label", "")
-            count = record.get("count", 0)
-            
-            # Simple heuristic: relationship types are usually ALL_CAPS
-            if label and label.isupper():
-                relationships.append({"type": label, "count": count})
-            else:
-                nodes.append({"label": label, "count": count})
-        
-        logger.info("Graph statistics retrieved")
-        
-        return {
-            "nodes": nodes,
-            "relationships": relationships,
-            "total_nodes": sum(node["count"] for node in nodes),
-            "total_relationships": sum(rel["count"] for rel in relationships),
-            "timestamp": datetime.now().isoformat()
-        }
-        
-    except Exception as e:
-        logger.error("Graph statistics retrieval failed", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve graph statistics: {str(e)}"
-        )
+    cache_key = ("graph_stats",)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
+    stats = await neo4j_service.get_graph_statistics()
+    nodes = sorted(stats["nodes"], key=lambda node: node["count"], reverse=True)
+    relationships = sorted(stats["relationships"], key=lambda rel: rel["count"], reverse=True)
+    
+    logger.info("Graph statistics retrieved")
+    
+    response = {
+        "nodes": nodes,
+        "relationships": relationships,
+        "total_nodes": sum(node["count"] for node in nodes),
+        "total_relationships": sum(rel["count"] for rel in relationships),
+        "timestamp": datetime.now().isoformat()
+    }
+    cache.set(cache_key, response)
+    return ORJSONResponse(response)
 
 
+@router.get(
+    "/cache/stats",
+    summary="Graph Cache Statistics",
+    description="Get size and hit statistics for the graph read cache"
+)
+async def get_graph_cache_stats(
+    cache: TTLCache = Depends(get_graph_cache)
+):
+    """Get graph read cache statistics."""
+    return cache.stats()
+
+
+@router.post(
+    "/cache/clear",
+    summary="Clear Graph Cache",
+    description="Drop every cached graph read result"
+)
+async def clear_graph_cache(
+    cache: TTLCache = Depends(get_graph_cache)
+):
+    """Clear the graph read cache."""
+    cleared = cache.clear()
+    logger.info("Graph cache cleared", entries_cleared=cleared)
+    return {
+        "success": True,
+        "entries_cleared": cleared
+    }
@@ -5,27 +5,45 @@ Provides AI-powered assistance for geometric construction, proof checking,
 and educational guidance inspired by the MAGI systems from Evangelion.
 """
 
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+import hashlib
+import re
+from typing import Dict, List, Mapping, Optional, Any, Tuple
+from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
+import orjson
 import structlog
 
-from app.services.rust_bridge import RustGeometryService, ConstructionSpace
+from app.services.rust_bridge import (
+    RustGeometryService, ConstructionSpace, get_rust_service as get_shared_rust_service
+)
+from app.core.config import get_settings
 from app.core.exceptions import MAGIError
 
 logger = structlog.get_logger()
+settings = get_settings()
 router = APIRouter()
 
-class MAGISystem(str, Enum):
+class _ValueStrEnum(str, Enum):
+    """String enum whose str() and format() give the plain value on every Python version."""
+    
+    def __str__(self) -> str:
+        return self._value_
+    
+    __format__ = str.__format__
+
+class MAGISystem(_ValueStrEnum):
     """The three MAGI systems, each with different specializations."""
     CASPER = "casper"      # Construction and creative problem solving
     MELCHIOR = "melchior"  # Mathematical analysis and proof verification  
     BALTHASAR = "balthasar" # Educational guidance and step-by-step teaching
 
-class QueryType(str, Enum):
+class QueryType(_ValueStrEnum):
     """Types of queries the MAGI can handle."""
     CONSTRUCTION_HELP = "construction_help"
     PROOF_CHECK = "proof_check"
@@ -53,7 +71,15 @@ class MAGIResponse(BaseModel):
     next_steps: List[str] = Field(default=[], description="Recommended next steps")
     confidence: float = Field(..., description="Confidence in the response (0-1)")
     additional_resources: List[Dict[str, str]] = Field(default=[], description="Additional learning resources")
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class MAGIBatchQuery(BaseModel):
+    """Several queries to the MAGI systems answered in one request."""
+    queries: List[MAGIQuery] = Field(..., min_length=1, max_length=100)
+
+class MAGIBatchResponse(BaseModel):
+    """Responses to a batch of MAGI queries, in query order."""
+    responses: List[MAGIResponse]
 
 class ProofVerificationRequest(BaseModel):
     """Request for proof verification."""
@@ -72,8 +98,42 @@ class ProofVerificationResponse(BaseModel):
     alternative_approaches: List[str] = []
 
 async def get_rust_service() -> RustGeometryService:
-    """Get the Rust geometry service."""
-    return RustGeometryService()
+    """Get the shared Rust geometry service."""
+    return get_shared_rust_service()
+
+def _magi_http_error(status_code: int, message: str, error: Exception) -> HTTPException:
+    """Build the HTTP error for a failed MAGI operation."""
+    return HTTPException(status_code=status_code, detail=f"{message}: {error}")
+
+def _model_response(model: BaseModel):
+    """Build the response for a model the endpoint constructed itself.
+    
+    The model was validated when it was built, so it is serialized
+    directly rather than validated again against the route's
+    response_model, unless response validation is enabled for debugging.
+    """
+    if settings.validate_api_response:
+        return model
+    return ORJSONResponse(model.model_dump())
+
+# Learning paths and theorem information are fixed for a given set of
+# arguments, so clients and proxies may reuse them
+_STATIC_CACHE_CONTROL = "public, max-age=3600"
+
+def _json_body(payload: Mapping[str, Any]) -> Tuple[bytes, str]:
+    """Serialize a payload and compute its strong ETag."""
+    body = orjson.dumps(dict(payload))
+    return body, f'"{hashlib.sha256(body).hexdigest()}"'
+
+def _static_json_response(request: Request, body: bytes, etag: str) -> Response:
+    """Return a cacheable JSON body, or 304 if the client already has it."""
+    headers = {"ETag": etag, "Cache-Control": _STATIC_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        client_etags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in client_etags or "*" in client_etags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 @router.post(
     "/query",
@@ -91,7 +151,7 @@ async def query_magi(
         magi_system = _select_magi_system(query)
         
         # Generate response based on query type and MAGI system
-        response = await _generate_magi_response(query, magi_system, rust_service)
+        response = _generate_magi_response(query, magi_system, rust_service)
         
         logger.info(
             "MAGI query processed",
@@ -100,14 +160,36 @@ async def query_magi(
             confidence=response.confidence
         )
         
-        return response
+        return _model_response(response)
         
     except Exception as e:
-        logger.error("MAGI query failed", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"MAGI query failed: {str(e)}"
-        )
+        logger.exception("MAGI query failed")
+        raise _magi_http_error(status.HTTP_500_INTERNAL_SERVER_ERROR, "MAGI query failed", e)
+
+@router.post(
+    "/query/batch",
+    response_model=MAGIBatchResponse,
+    summary="Query MAGI System in Batch",
+    description="Send several queries to the MAGI AI system in one request"
+)
+async def query_magi_batch(
+    batch: MAGIBatchQuery,
+    rust_service: RustGeometryService = Depends(get_rust_service)
+):
+    """Query the MAGI system with several queries at once."""
+    try:
+        responses = [
+            _generate_magi_response(query, _select_magi_system(query), rust_service)
+            for query in batch.queries
+        ]
+        
+        logger.info("MAGI batch processed", queries=len(responses))
+        
+        return _model_response(MAGIBatchResponse(responses=responses))
+        
+    except Exception as e:
+        logger.exception("MAGI batch query failed")
+        raise _magi_http_error(status.HTTP_500_INTERNAL_SERVER_ERROR, "MAGI batch query failed", e)
 
 @router.post(
     "/verify-proof",
@@ -121,7 +203,7 @@ async def verify_proof(
 ):
     """Verify a geometric proof using MELCHIOR (analysis specialist)."""
     try:
-        verification = await _verify_geometric_proof(request, rust_service)
+        verification = _verify_geometric_proof(request, rust_service)
         
         logger.info(
             "Proof verification completed",
@@ -130,14 +212,11 @@ async def verify_proof(
             errors_found=len(verification.errors_found)
         )
         
-        return verification
+        return _model_response(verification)
         
     except Exception as e:
-        logger.error("Proof verification failed", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=f"Proof verification failed: {str(e)}"
-        )
+        logger.exception("Proof verification failed")
+        raise _magi_http_error(status.HTTP_422_UNPROCESSABLE_ENTITY, "Proof verification failed", e)
 
 @router.get(
     "/learning-path/{topic}",
@@ -146,6 +225,7 @@ async def verify_proof(
     description="Get a structured learning path for a geometric topic"
 )
 async def get_learning_path(
+    request: Request,
     topic: str,
     current_level: str = "beginner",
     include_prerequisites: bool = True
@@ -161,13 +241,14 @@ async def get_learning_path(
             steps=len(learning_path.get("steps", []))
         )
         
-        return learning_path
+        return _static_json_response(
+            request, *_learning_path_body(topic, current_level, include_prerequisites)
+        )
         
     except Exception as e:
-        logger.error("Learning path generation failed", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Learning path generation failed: {str(e)}"
+        logger.exception("Learning path generation failed")
+        raise _magi_http_error(
+            status.HTTP_500_INTERNAL_SERVER_ERROR, "Learning path generation failed", e
         )
 
 @router.post(
@@ -184,7 +265,7 @@ async def analyze_error(
 ):
     """Analyze construction errors and provide guidance."""
     try:
-        analysis = await _analyze_construction_error(
+        analysis = _analyze_construction_error(
             construction_space, 
             error_description, 
             attempted_construction,
@@ -200,11 +281,8 @@ async def analyze_error(
         return analysis
         
     except Exception as e:
-        logger.error("Error analysis failed", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=f"Error analysis failed: {str(e)}"
-        )
+        logger.exception("Error analysis failed")
+        raise _magi_http_error(status.HTTP_422_UNPROCESSABLE_ENTITY, "Error analysis failed", e)
 
 @router.get(
     "/theorem/{theorem_name}",
@@ -213,6 +291,7 @@ async def analyze_error(
     description="Get detailed information about a geometric theorem"
 )
 async def get_theorem_info(
+    request: Request,
     theorem_name: str,
     include_proof: bool = True,
     include_applications: bool = True,
@@ -220,11 +299,8 @@ async def get_theorem_info(
 ):
     """Get detailed information about a geometric theorem."""
     try:
-        theorem_info = _get_theorem_information(
-            theorem_name, 
-            include_proof, 
-            include_applications,
-            difficulty_level
+        body, etag = _theorem_information_body(
+            theorem_name, include_proof, include_applications, difficulty_level
         )
         
         logger.info(
@@ -233,14 +309,25 @@ async def get_theorem_info(
             difficulty=difficulty_level
         )
         
-        return theorem_info
+        return _static_json_response(request, body, etag)
         
     except Exception as e:
-        logger.error("Theorem info retrieval failed", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Theorem information not found: {str(e)}"
-        )
+        logger.exception("Theorem info retrieval failed")
+        raise _magi_http_error(status.HTTP_404_NOT_FOUND, "Theorem information not found", e)
+
+# MAGI system that handles each query type
+_QUERY_TYPE_TO_MAGI = MappingProxyType({
+    # Creative problem solving
+    QueryType.CONSTRUCTION_HELP: MAGISystem.CASPER,
+    QueryType.HINT_REQUEST: MAGISystem.CASPER,
+    # Mathematical analysis
+    QueryType.PROOF_CHECK: MAGISystem.MELCHIOR,
+    QueryType.ERROR_ANALYSIS: MAGISystem.MELCHIOR,
+    # Educational guidance
+    QueryType.STEP_EXPLANATION: MAGISystem.BALTHASAR,
+    QueryType.LEARNING_PATH: MAGISystem.BALTHASAR,
+    QueryType.THEOREM_INFO: MAGISystem.BALTHASAR,
+})
 
 def _select_magi_system(query: MAGIQuery) -> MAGISystem:
     """Select the most appropriate MAGI system for a query."""
@@ -248,18 +335,78 @@ def _select_magi_system(query: MAGIQuery) -> MAGISystem:
     if query.preferred_magi:
         return query.preferred_magi
     
-    # Route based on query type
-    if query.query_type in [QueryType.CONSTRUCTION_HELP, QueryType.HINT_REQUEST]:
-        return MAGISystem.CASPER  # Creative problem solving
-    elif query.query_type in [QueryType.PROOF_CHECK, QueryType.ERROR_ANALYSIS]:
-        return MAGISystem.MELCHIOR  # Mathematical analysis
-    elif query.query_type in [QueryType.STEP_EXPLANATION, QueryType.LEARNING_PATH, QueryType.THEOREM_INFO]:
-        return MAGISystem.BALTHASAR  # Educational guidance
-    
     # Default to CASPER for general queries
-    return MAGISystem.CASPER
+    return _QUERY_TYPE_TO_MAGI.get(query.query_type, MAGISystem.CASPER)
+
+# Response templates per (MAGI system, query type). Content is formatted
+# with the system name and the query text after lookup.
+_MAGI_RESPONSE_TEMPLATES = MappingProxyType({
+    (MAGISystem.CASPER, QueryType.CONSTRUCTION_HELP): {
+        "content": "CASPER suggests approaching '{content}' by breaking it into fundamental steps. Consider starting with the basic elements you have and work systematically toward your goal.",
+        "suggestions": (
+            "Identify what geometric objects you already have",
+            "List what objects you need to create",
+            "Find the fundamental constructions that bridge the gap",
+            "Use compass and straightedge rules systematically"
+        ),
+        "confidence": 0.85
+    },
+    (MAGISystem.MELCHIOR, QueryType.PROOF_CHECK): {
+        "content": "MELCHIOR has analyzed your construction. The logical structure appears sound, but I need to verify each step rigorously.",
+        "suggestions": (
+            "Ensure each step follows logically from previous steps",
+            "Verify that all geometric objects are properly defined",
+            "Check that compass and straightedge rules are followed",
+            "Confirm the final result matches the intended theorem"
+        ),
+        "confidence": 0.78
+    },
+    (MAGISystem.BALTHASAR, QueryType.STEP_EXPLANATION): {
+        "content": "BALTHASAR will guide you through this step by step. '{content}' can be understood by examining the underlying geometric principles.",
+        "suggestions": (
+            "Start with what you already understand about the problem",
+            "Connect this to geometric principles you've learned before",
+            "Practice similar constructions to build intuition",
+            "Ask questions when something isn't clear"
+        ),
+        "confidence": 0.92
+    }
+})
+
+_MAGI_DEFAULT_TEMPLATE = MappingProxyType({
+    "content": "{system} is processing your query about '{content}'. This is a complex geometric problem that requires careful analysis.",
+    "suggestions": (
+        "Break the problem into smaller parts",
+        "Use fundamental geometric principles",
+        "Work systematically and check each step"
+    ),
+    "confidence": 0.70
+})
+
+_MAGI_ADDITIONAL_RESOURCES = (
+    {
+        "title": "Euclid's Elements - Relevant Propositions",
+        "url": "https://mathcs.clarku.edu/~djoyce/elements/elements.html",
+        "description": "Classical geometric constructions and proofs"
+    },
+    {
+        "title": "Interactive Geometry Software",
+        "url": "https://www.geogebra.org/",
+        "description": "Practice geometric constructions interactively"
+    }
+)
+
+def _next_construction_step(construction_space: ConstructionSpace) -> str:
+    """Suggest what to construct next based on what the space lacks."""
+    if not construction_space.points:
+        return "Start by placing some initial points"
+    if not construction_space.lines:
+        return "Try constructing lines through your points"
+    if not construction_space.circles:
+        return "Consider adding circles to find intersections"
+    return "Look for intersections to create new points"
 
-async def _generate_magi_response(
+def _generate_magi_response(
     query: MAGIQuery, 
     magi_system: MAGISystem, 
     rust_service: RustGeometryService
@@ -268,88 +415,25 @@ async def _generate_magi_response(
     
     # This is a simplified AI response generator
     # In a real system, this would integrate with actual AI/ML models
-    
-    responses = {
-        (MAGISystem.CASPER, QueryType.CONSTRUCTION_HELP): {
-            "content": f"CASPER suggests approaching '{query.content}' by breaking it into fundamental steps. Consider starting with the basic elements you have and work systematically toward your goal.",
-            "suggestions": [
-                "Identify what geometric objects you already have",
-                "List what objects you need to create",
-                "Find the fundamental constructions that bridge the gap",
-                "Use compass and straightedge rules systematically"
-            ],
-            "confidence": 0.85
-        },
-        (MAGISystem.MELCHIOR, QueryType.PROOF_CHECK): {
-            "content": f"MELCHIOR has analyzed your construction. The logical structure appears sound, but I need to verify each step rigorously.",
-            "suggestions": [
-                "Ensure each step follows logically from previous steps",
-                "Verify that all geometric objects are properly defined",
-                "Check that compass and straightedge rules are followed",
-                "Confirm the final result matches the intended theorem"
-            ],
-            "confidence": 0.78
-        },
-        (MAGISystem.BALTHASAR, QueryType.STEP_EXPLANATION): {
-            "content": f"BALTHASAR will guide you through this step by step. '{query.content}' can be understood by examining the underlying geometric principles.",
-            "suggestions": [
-                "Start with what you already understand about the problem",
-                "Connect this to geometric principles you've learned before",
-                "Practice similar constructions to build intuition",
-                "Ask questions when something isn't clear"
-            ],
-            "confidence": 0.92
-        }
-    }
-    
-    # Get response template or default
-    key = (magi_system, query.query_type)
-    template = responses.get(key, {
-        "content": f"{magi_system.value.upper()} is processing your query about '{query.content}'. This is a complex geometric problem that requires careful analysis.",
-        "suggestions": [
-            "Break the problem into smaller parts",
-            "Use fundamental geometric principles",
-            "Work systematically and check each step"
-        ],
-        "confidence": 0.70
-    })
+    template = _MAGI_RESPONSE_TEMPLATES.get((magi_system, query.query_type), _MAGI_DEFAULT_TEMPLATE)
+    content = template["content"].format(system=magi_system.value.upper(), content=query.content)
     
     # Add context-specific suggestions if construction space is provided
     next_steps = []
     if query.construction_space:
-        if len(query.construction_space.points) == 0:
-            next_steps.append("Start by placing some initial points")
-        elif len(query.construction_space.lines) == 0:
-            next_steps.append("Try constructing lines through your points")
-        elif len(query.construction_space.circles) == 0:
-            next_steps.append("Consider adding circles to find intersections")
-        else:
-            next_steps.append("Look for intersections to create new points")
-    
-    additional_resources = [
-        {
-            "title": f"Euclid's Elements - Relevant Propositions",
-            "url": "https://mathcs.clarku.edu/~djoyce/elements/elements.html",
-            "description": "Classical geometric constructions and proofs"
-        },
-        {
-            "title": "Interactive Geometry Software",
-            "url": "https://www.geogebra.org/",
-            "description": "Practice geometric constructions interactively"
-        }
-    ]
+        next_steps.append(_next_construction_step(query.construction_space))
     
     return MAGIResponse(
         magi_system=magi_system,
         response_type=query.query_type,
-        content=template["content"],
+        content=content,
         suggestions=template["suggestions"],
         next_steps=next_steps,
         confidence=template["confidence"],
-        additional_resources=additional_resources
+        additional_resources=_MAGI_ADDITIONAL_RESOURCES
     )
 
-async def _verify_geometric_proof(
+def _verify_geometric_proof(
     request: ProofVerificationRequest,
     rust_service: RustGeometryService
 ) -> ProofVerificationResponse:
@@ -371,10 +455,12 @@ async def _verify_geometric_proof(
         errors_found.append("Proof appears incomplete - very few steps provided")
         missing_steps.append("More detailed explanation of each construction step")
     
-    if "given" not in " ".join(request.proof_steps).lower():
+    lowered_steps = [step.lower() for step in request.proof_steps]
+    
+    if not any("given" in step for step in lowered_steps):
         missing_steps.append("Clearly state what is given in the problem")
     
-    if "therefore" not in " ".join(request.proof_steps).lower():
+    if not any("therefore" in step or "hence" in step for step in lowered_steps):
         missing_steps.append("Include a clear conclusion with 'therefore' or 'hence'")
     
     # Check construction space consistency
@@ -410,8 +496,13 @@ async def _verify_geometric_proof(
         alternative_approaches=alternative_approaches
     )
 
-def _generate_learning_path(topic: str, level: str, include_prerequisites: bool) -> Dict[str, Any]:
-    """Generate a structured learning path for a topic."""
+@lru_cache(maxsize=256)
+def _generate_learning_path(topic: str, level: str, include_prerequisites: bool) -> Mapping[str, Any]:
+    """Generate a structured learning path for a topic.
+    
+    The result is cached and shared between requests, so it is returned
+    as a read-only mapping.
+    """
     
     learning_paths = {
         "triangles": {
@@ -476,7 +567,7 @@ def _generate_learning_path(topic: str, level: str, include_prerequisites: bool)
         }
     }
     
-    return learning_paths.get(topic.lower(), {
+    return MappingProxyType(learning_paths.get(topic.lower(), {
         "title": f"Learning Path for {topic.title()}",
         "description": f"Custom learning path for {topic}",
         "steps": [
@@ -488,77 +579,113 @@ def _generate_learning_path(topic: str, level: str, include_prerequisites: bool)
             }
         ],
         "estimated_time": "1-2 weeks"
-    })
+    }))
 
-async def _analyze_construction_error(
-    construction_space: ConstructionSpace,
-    error_description: str,
-    attempted_construction: Optional[str],
-    rust_service: RustGeometryService
-) -> Dict[str, Any]:
-    """Analyze construction errors."""
-    
-    error_analysis = {
-        "error_type": "unknown",
-        "severity": "medium",
-        "likely_causes": [],
-        "suggestions": [],
-        "corrective_steps": []
-    }
-    
-    # Simple error classification
-    error_lower = error_description.lower()
-    
-    if "point" in error_lower and ("same" in error_lower or "identical" in error_lower):
-        error_analysis.update({
+@lru_cache(maxsize=256)
+def _learning_path_body(topic: str, level: str, include_prerequisites: bool) -> Tuple[bytes, str]:
+    """Get the serialized learning path for a topic and its ETag."""
+    return _json_body(_generate_learning_path(topic, level, include_prerequisites))
+
+# Words with inner apostrophes kept whole, so "can't" stays one word
+_WORD_PATTERN = re.compile(r"[a-z]+(?:'[a-z]+)*")
+
+# Error classifications as (subject words, condition words, analysis).
+# A description matches when it contains a word from both sets; the first
+# match wins.
+_ERROR_CLASSIFICATIONS = (
+    (
+        frozenset({"point", "points"}),
+        frozenset({"same", "identical", "coincident", "duplicate", "duplicated"}),
+        MappingProxyType({
             "error_type": "identical_points",
             "severity": "high",
-            "likely_causes": ["Trying to create line/circle with identical points"],
-            "suggestions": [
+            "likely_causes": ("Trying to create line/circle with identical points",),
+            "suggestions": (
                 "Ensure points are distinct before creating lines or circles",
                 "Check point coordinates to verify they are different",
                 "Use the point creation tool to add new distinct points"
-            ],
-            "corrective_steps": [
+            ),
+            "corrective_steps": (
                 "Create a new point at different coordinates",
                 "Verify all points have unique positions",
                 "Retry the construction with distinct points"
-            ]
+            )
         })
-    
-    elif "intersection" in error_lower and ("none" in error_lower or "no" in error_lower):
-        error_analysis.update({
+    ),
+    (
+        frozenset({
+            "intersection", "intersections", "intersect", "intersects",
+            "intersected", "intersecting"
+        }),
+        frozenset({
+            "no", "none", "not", "nothing", "never", "unable", "cannot", "can't",
+            "couldn't", "don't", "doesn't", "didn't", "won't"
+        }),
+        MappingProxyType({
             "error_type": "no_intersection",
             "severity": "medium",
-            "likely_causes": ["Geometric objects don't intersect", "Objects are parallel or too far apart"],
-            "suggestions": [
+            "likely_causes": ("Geometric objects don't intersect", "Objects are parallel or too far apart"),
+            "suggestions": (
                 "Check if the objects actually intersect geometrically",
                 "Adjust the size or position of circles",
                 "Verify the construction logic"
-            ],
-            "corrective_steps": [
+            ),
+            "corrective_steps": (
                 "Review the geometric relationship between objects",
                 "Modify circle radii to ensure intersection",
                 "Check for parallel lines that won't intersect"
-            ]
+            )
         })
-    
-    elif "construct" in error_lower and "fail" in error_lower:
-        error_analysis.update({
+    ),
+    (
+        frozenset({
+            "construct", "constructs", "constructed", "constructing",
+            "construction", "constructions"
+        }),
+        frozenset({"fail", "fails", "failed", "failing", "failure", "failures"}),
+        MappingProxyType({
             "error_type": "construction_failure",
             "severity": "high",
-            "likely_causes": ["Missing prerequisites", "Invalid construction sequence"],
-            "suggestions": [
+            "likely_causes": ("Missing prerequisites", "Invalid construction sequence"),
+            "suggestions": (
                 "Verify all required objects exist before construction",
                 "Follow the proper construction sequence",
                 "Check that compass and straightedge rules are followed"
-            ],
-            "corrective_steps": [
+            ),
+            "corrective_steps": (
                 "List all objects needed for the construction",
                 "Create missing prerequisite objects first",
                 "Retry construction in the correct order"
-            ]
+            )
         })
+    ),
+)
+
+_UNKNOWN_ERROR_ANALYSIS = MappingProxyType({
+    "error_type": "unknown",
+    "severity": "medium",
+    "likely_causes": (),
+    "suggestions": (),
+    "corrective_steps": ()
+})
+
+def _classify_construction_error(error_description: str) -> Mapping[str, Any]:
+    """Return the analysis for the first classification an error matches."""
+    words = frozenset(_WORD_PATTERN.findall(error_description.lower().replace("\u2019", "'")))
+    
+    for subject_words, condition_words, classification in _ERROR_CLASSIFICATIONS:
+        if words & subject_words and words & condition_words:
+            return classification
+    
+    return _UNKNOWN_ERROR_ANALYSIS
+
+def _analyze_construction_error(
+    construction_space: ConstructionSpace,
+    error_description: str,
+    attempted_construction: Optional[str],
+    rust_service: RustGeometryService
+) -> Dict[str, Any]:
+    """Analyze construction errors."""
     
     # Add context from construction space
     context_notes = []
@@ -567,23 +694,44 @@ async def _analyze_construction_error(
     if len(construction_space.history) == 0:
         context_notes.append("No construction history - this appears to be a fresh start")
     
-    error_analysis["context_notes"] = context_notes
-    error_analysis["construction_summary"] = {
-        "points": len(construction_space.points),
-        "lines": len(construction_space.lines),
-        "circles": len(construction_space.circles),
-        "steps": len(construction_space.history)
+    return {
+        **_classify_construction_error(error_description),
+        "context_notes": context_notes,
+        "construction_summary": {
+            "points": len(construction_space.points),
+            "lines": len(construction_space.lines),
+            "circles": len(construction_space.circles),
+            "steps": len(construction_space.history)
+        }
     }
-    
-    return error_analysis
 
-def _get_theorem_information(
-    theorem_name: str,
+# Parts of the theorem information that are the same for every theorem
+_THEOREM_LEARNING_RESOURCES = (
+    {
+        "title": "Euclid's Elements",
+        "description": "Classical geometric theorems and proofs",
+        "relevance": "foundational"
+    },
+    {
+        "title": "Interactive Geometry",
+        "description": "Hands-on exploration of geometric theorems",
+        "relevance": "practical"
+    }
+)
+
+_THEOREM_NEXT_TOPICS = ("related_constructions", "advanced_applications")
+
+@lru_cache(maxsize=128)
+def _known_theorem(
+    theorem_key: str,
     include_proof: bool,
-    include_applications: bool,
-    difficulty_level: str
-) -> Dict[str, Any]:
-    """Get detailed information about a geometric theorem."""
+    include_applications: bool
+) -> Optional[Dict[str, Any]]:
+    """Look up a theorem in the knowledge base, or None if it is unknown.
+    
+    The result is cached and shared between requests and must not be
+    modified.
+    """
     
     theorems = {
         "pythagorean_theorem": {
@@ -618,8 +766,18 @@ def _get_theorem_information(
         }
     }
     
+    return theorems.get(theorem_key)
+
+def _get_theorem_information(
+    theorem_name: str,
+    include_proof: bool,
+    include_applications: bool,
+    difficulty_level: str
+) -> Mapping[str, Any]:
+    """Get detailed information about a geometric theorem."""
+    
     theorem_key = theorem_name.lower().replace(" ", "_")
-    theorem_info = theorems.get(theorem_key)
+    theorem_info = _known_theorem(theorem_key, include_proof, include_applications)
     
     if not theorem_info:
         # Generate basic info for unknown theorems
@@ -631,20 +789,21 @@ def _get_theorem_information(
             "construction_applications": []
         }
     
-    return {
+    return MappingProxyType({
         "theorem": theorem_info,
-        "learning_resources": [
-            {
-                "title": "Euclid's Elements",
-                "description": "Classical geometric theorems and proofs",
-                "relevance": "foundational"
-            },
-            {
-                "title": "Interactive Geometry",
-                "description": "Hands-on exploration of geometric theorems",
-                "relevance": "practical"
-            }
-        ],
+        "learning_resources": _THEOREM_LEARNING_RESOURCES,
         "difficulty_level": difficulty_level,
-        "next_topics": ["related_constructions", "advanced_applications"]
-    }
\ No newline at end of file
+        "next_topics": _THEOREM_NEXT_TOPICS
+    })
+
+@lru_cache(maxsize=256)
+def _theorem_information_body(
+    theorem_name: str,
+    include_proof: bool,
+    include_applications: bool,
+    difficulty_level: str
+) -> Tuple[bytes, str]:
+    """Get the serialized information about a theorem and its ETag."""
+    return _json_body(
+        _get_theorem_information(theorem_name, include_proof, include_applications, difficulty_level)
+    )
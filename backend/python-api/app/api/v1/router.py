@@ -10,38 +10,20 @@ from app.api.v1.endpoints import geometry, construction, collection, magi, graph
 
 api_router = APIRouter()
 
-# Include all endpoint modules
-api_router.include_router(
-    geometry.router, 
-    prefix="/geometry", 
-    tags=["geometry"],
-    responses={404: {"description": "Not found"}}
-)
-
-api_router.include_router(
-    construction.router,
-    prefix="/construction", 
-    tags=["construction"],
-    responses={404: {"description": "Not found"}}
-)
-
-api_router.include_router(
-    collection.router,
-    prefix="/collection",
-    tags=["collection"],
-    responses={404: {"description": "Not found"}}
-)
+# Responses documented for every endpoint module
+_DEFAULT_RESPONSES = {404: {"description": "Not found"}}
 
-api_router.include_router(
-    magi.router,
-    prefix="/magi",
-    tags=["magi", "ai"],
-    responses={404: {"description": "Not found"}}
-)
-
-api_router.include_router(
-    graph.router,
-    prefix="/graph",
-    tags=["graph", "neo4j"],
-    responses={404: {"description": "Not found"}}
-)
\ No newline at end of file
+# Include all endpoint modules
+for endpoint_module, prefix, tags in (
+    (geometry, "/geometry", ["geometry"]),
+    (construction, "/construction", ["construction"]),
+    (collection, "/collection", ["collection"]),
+    (magi, "/magi", ["magi", "ai"]),
+    (graph, "/graph", ["graph", "neo4j"]),
+):
+    api_router.include_router(
+        endpoint_module.router,
+        prefix=prefix,
+        tags=tags,
+        responses=_DEFAULT_RESPONSES
+    )
@@ -6,8 +6,7 @@ with validation and type hints.
 """
 
 import os
-from functools import lru_cache
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from pydantic import Field, validator
 from pydantic_settings import BaseSettings
@@ -27,7 +26,9 @@ class Settings(BaseSettings):
     
     # API configuration
     api_v1_prefix: str = "/api/v1"
-    allowed_hosts: List[str] = Field(
+    # Union with str so a comma-separated ALLOWED_HOSTS reaches
+    # parse_allowed_hosts instead of failing JSON decoding
+    allowed_hosts: Union[List[str], str] = Field(
         default=[
             "http://localhost:3000", "http://127.0.0.1:3000", 
             "http://localhost:3001", "http://127.0.0.1:3001",
@@ -57,6 +58,9 @@ class Settings(BaseSettings):
     neo4j_user: str = Field(default="neo4j", env="NEO4J_USER")
     neo4j_password: str = Field(default="nervgeometry", env="NEO4J_PASSWORD")
     neo4j_database: str = Field(default="neo4j", env="NEO4J_DATABASE")
+    neo4j_max_connection_pool_size: int = Field(default=100, env="NEO4J_MAX_CONNECTION_POOL_SIZE")
+    neo4j_connection_acquisition_timeout: float = Field(default=30.0, env="NEO4J_CONNECTION_ACQUISITION_TIMEOUT")
+    neo4j_max_connection_lifetime: int = Field(default=1200, env="NEO4J_MAX_CONNECTION_LIFETIME")
     
     # Redis configuration
     redis_url: str = Field(
@@ -92,6 +96,14 @@ class Settings(BaseSettings):
         description="Path to Rust geometry library"
     )
     
+    # Server-side construction space store
+    space_store_max_spaces: int = Field(default=1024, env="SPACE_STORE_MAX_SPACES")
+    space_store_ttl_seconds: int = Field(default=3600, env="SPACE_STORE_TTL_SECONDS")
+    
+    # Graph read cache
+    graph_cache_max_entries: int = Field(default=4096, env="GRAPH_CACHE_MAX_ENTRIES")
+    graph_cache_ttl_seconds: int = Field(default=30, env="GRAPH_CACHE_TTL_SECONDS")
+    
     # WebSocket configuration
     websocket_max_connections: int = Field(default=100, env="WEBSOCKET_MAX_CONNECTIONS")
     websocket_ping_interval: int = Field(default=20, env="WEBSOCKET_PING_INTERVAL")
@@ -99,6 +111,13 @@ class Settings(BaseSettings):
     # Performance settings
     worker_processes: int = Field(default=1, env="WORKER_PROCESSES")
     max_request_size: int = Field(default=10 * 1024 * 1024, env="MAX_REQUEST_SIZE")  # 10MB
+    validate_api_response: bool = Field(
+        default=False,
+        env="VALIDATE_API_RESPONSE",
+        description="Re-validate engine output against response models (debugging aid)"
+    )
+    gzip_minimum_size: int = Field(default=4096, env="GZIP_MINIMUM_SIZE")
+    gzip_compress_level: int = Field(default=5, env="GZIP_COMPRESS_LEVEL")
     
     # Logging configuration
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
@@ -160,7 +179,7 @@ class ProductionSettings(Settings):
     
     # Override defaults for production
     secret_key: str = Field(env="SECRET_KEY")  # Required in production
-    allowed_hosts: List[str] = Field(env="ALLOWED_HOSTS")  # Required in production
+    allowed_hosts: Union[List[str], str] = Field(env="ALLOWED_HOSTS")  # Required in production
 
 
 class TestingSettings(Settings):
@@ -175,14 +194,8 @@ class TestingSettings(Settings):
     redis_url: str = "redis://localhost:6380"  # Test Redis instance
 
 
-@lru_cache()
-def get_settings() -> Settings:
-    """
-    Get application settings with caching.
-    
-    The settings are cached to avoid re-reading environment variables
-    on every function call.
-    """
+def _build_settings() -> Settings:
+    """Build the settings class for the current ENVIRONMENT."""
     environment = os.getenv("ENVIRONMENT", "development").lower()
     
     if environment == "production":
@@ -194,4 +207,14 @@ def get_settings() -> Settings:
 
 
 # Export settings instance for easy access
-settings = get_settings()
\ No newline at end of file
+settings = _build_settings()
+
+
+def get_settings() -> Settings:
+    """
+    Get application settings.
+    
+    The settings are read from the environment once, at import, so
+    callers share a single instance.
+    """
+    return settings
@@ -7,10 +7,12 @@ and detailed error messages for debugging.
 
 from typing import Any, Dict
 
+import orjson
 import structlog
-from fastapi import FastAPI, HTTPException, Request, status
+from fastapi import FastAPI, HTTPException, Request, Response, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from neo4j.exceptions import ClientError, ConstraintError, DriverError, Neo4jError, TransientError
 from pydantic import ValidationError
 
 logger = structlog.get_logger()
@@ -107,20 +109,22 @@ class ProofVerificationError(NERVException):
         )
 
 
-async def nerv_exception_handler(request: Request, exc: NERVException) -> JSONResponse:
+async def nerv_exception_handler(request: Request, exc: NERVException) -> ORJSONResponse:
     """Handle custom NERV exceptions."""
     
+    # Most exceptions carry no details; leave the key out of their log line
+    extra = {"details": exc.details} if exc.details else {}
     logger.error(
         "NERV exception occurred",
         exception=exc.__class__.__name__,
         message=exc.message,
         status_code=exc.status_code,
-        details=exc.details,
         path=request.url.path,
-        method=request.method
+        method=request.method,
+        **extra
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {
@@ -133,7 +137,7 @@ async def nerv_exception_handler(request: Request, exc: NERVException) -> JSONRe
     )
 
 
-async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
     """Handle Pydantic validation errors."""
     
     logger.warning(
@@ -144,7 +148,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         method=request.method
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": {
@@ -160,7 +164,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
     """Handle HTTP exceptions."""
     
     logger.warning(
@@ -171,7 +175,7 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
         method=request.method
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {
@@ -183,7 +187,52 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def graph_database_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    """Handle Neo4j driver and server errors raised by graph operations."""
+    
+    if isinstance(exc, ConstraintError):
+        status_code = status.HTTP_409_CONFLICT
+    elif isinstance(exc, ClientError):
+        status_code = status.HTTP_400_BAD_REQUEST
+    elif isinstance(exc, (TransientError, DriverError)):
+        status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    else:
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    
+    logger.error(
+        "Graph database error occurred",
+        exception=exc.__class__.__name__,
+        message=str(exc),
+        status_code=status_code,
+        path=request.url.path,
+        method=request.method
+    )
+    
+    return ORJSONResponse(
+        status_code=status_code,
+        content={
+            "error": {
+                "type": "GraphDatabaseError",
+                "message": str(exc),
+                "details": {"code": getattr(exc, "code", None)},
+                "status_code": status_code
+            }
+        }
+    )
+
+
+# Body of every unexpected-error response; it never varies, so it is
+# serialized once
+_INTERNAL_SERVER_ERROR_BODY = orjson.dumps({
+    "error": {
+        "type": "InternalServerError",
+        "message": "An unexpected error occurred",
+        "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR
+    }
+})
+
+
+async def general_exception_handler(request: Request, exc: Exception) -> Response:
     """Handle unexpected exceptions."""
     
     logger.error(
@@ -195,15 +244,10 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
         exc_info=True
     )
     
-    return JSONResponse(
+    return Response(
+        content=_INTERNAL_SERVER_ERROR_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": {
-                "type": "InternalServerError",
-                "message": "An unexpected error occurred",
-                "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR
-            }
-        }
+        media_type="application/json"
     )
 
 
@@ -220,5 +264,9 @@ def setup_exception_handlers(app: FastAPI) -> None:
     # HTTP exceptions
     app.add_exception_handler(HTTPException, http_exception_handler)
     
+    # Neo4j graph database errors
+    app.add_exception_handler(Neo4jError, graph_database_exception_handler)
+    app.add_exception_handler(DriverError, graph_database_exception_handler)
+    
     # Catch-all for unexpected exceptions
     app.add_exception_handler(Exception, general_exception_handler)
\ No newline at end of file
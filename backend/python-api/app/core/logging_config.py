@@ -8,8 +8,9 @@ and debugging capabilities.
 import logging
 import logging.config
 import sys
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
+import orjson
 import structlog
 from structlog.stdlib import LoggerFactory
 
@@ -18,6 +19,33 @@ from app.core.config import get_settings
 settings = get_settings()
 
 
+def _orjson_dumps(event_dict: Dict[str, Any], default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize a log event with orjson for structlog's JSONRenderer."""
+    return orjson.dumps(event_dict, default=default).decode()
+
+
+# Timestamp format and renderer for the configured log format
+if settings.log_format == "json":
+    # JSON logging for production, encoded with orjson
+    _TIMESTAMPER = structlog.processors.TimeStamper(fmt="iso")
+    _RENDERER = structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+else:
+    # Human-readable, colorized logging for development
+    _TIMESTAMPER = structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S")
+    _RENDERER = structlog.dev.ConsoleRenderer(colors=True)
+
+_PROCESSORS = (
+    # Add standard fields to every log entry
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.add_log_level,
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+    structlog.processors.UnicodeDecoder(),
+    _TIMESTAMPER,
+    _RENDERER,
+)
+
+
 def setup_logging():
     """Configure structured logging for the application."""
     
@@ -28,50 +56,18 @@ def setup_logging():
         level=getattr(logging, settings.log_level),
     )
     
-    # Configure structlog
-    if settings.log_format == "json":
-        # JSON logging for production
-        structlog.configure(
-            processors=[
-                # Add standard fields to every log entry
-                structlog.stdlib.filter_by_level,
-                structlog.stdlib.add_logger_name,
-                structlog.stdlib.add_log_level,
-                structlog.stdlib.PositionalArgumentsFormatter(),
-                structlog.processors.StackInfoRenderer(),
-                structlog.processors.format_exc_info,
-                structlog.processors.UnicodeDecoder(),
-                # Add timestamp
-                structlog.processors.TimeStamper(fmt="iso"),
-                # JSON output
-                structlog.processors.JSONRenderer()
-            ],
-            context_class=dict,
-            logger_factory=LoggerFactory(),
-            wrapper_class=structlog.stdlib.BoundLogger,
-            cache_logger_on_first_use=True,
-        )
-    else:
-        # Human-readable logging for development
-        structlog.configure(
-            processors=[
-                structlog.stdlib.filter_by_level,
-                structlog.stdlib.add_logger_name,
-                structlog.stdlib.add_log_level,
-                structlog.stdlib.PositionalArgumentsFormatter(),
-                structlog.processors.StackInfoRenderer(),
-                structlog.processors.format_exc_info,
-                structlog.processors.UnicodeDecoder(),
-                # Add timestamp
-                structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S"),
-                # Colorized console output
-                structlog.dev.ConsoleRenderer(colors=True)
-            ],
-            context_class=dict,
-            logger_factory=LoggerFactory(),
-            wrapper_class=structlog.stdlib.BoundLogger,
-            cache_logger_on_first_use=True,
-        )
+    # Configure structlog. Calls below the configured level return
+    # immediately instead of building an event dict and running the
+    # processor chain.
+    structlog.configure(
+        processors=list(_PROCESSORS),
+        context_class=dict,
+        logger_factory=LoggerFactory(),
+        wrapper_class=structlog.make_filtering_bound_logger(
+            getattr(logging, settings.log_level)
+        ),
+        cache_logger_on_first_use=True,
+    )
 
 
 def get_logger(name: str = "nerv"):
@@ -86,9 +82,7 @@ LOGGING_CONFIG: Dict[str, Any] = {
     "formatters": {
         "default": {
             "()": structlog.stdlib.ProcessorFormatter,
-            "processor": structlog.dev.ConsoleRenderer(colors=True) 
-            if settings.log_format != "json" 
-            else structlog.processors.JSONRenderer(),
+            "processor": _RENDERER,
         },
     },
     "handlers": {
@@ -41,33 +41,19 @@ class DatabaseSession:
             "type": "placeholder"
         }
 
-# Global database session
-_db_session: DatabaseSession = None
+# Global database session, connected once by init_db() at startup
+_db_session = DatabaseSession()
 
 async def get_db() -> AsyncGenerator[DatabaseSession, None]:
     """Get database session dependency for FastAPI."""
-    global _db_session
-    
-    if _db_session is None:
-        _db_session = DatabaseSession()
-        await _db_session.connect()
-    
-    try:
-        yield _db_session
-    finally:
-        # Session cleanup if needed
-        pass
+    yield _db_session
 
 async def init_db():
     """Initialize database connection."""
-    global _db_session
-    if _db_session is None:
-        _db_session = DatabaseSession()
+    if not _db_session.connected:
         await _db_session.connect()
 
 async def close_db():
     """Close database connection."""
-    global _db_session
-    if _db_session:
+    if _db_session.connected:
         await _db_session.disconnect()
-        _db_session = None
\ No newline at end of file
@@ -11,10 +11,11 @@ import time
 from contextlib import asynccontextmanager
 from typing import Dict, Any
 
-from fastapi import FastAPI, Request, Depends
+from fastapi import FastAPI, Request, Depends, Response
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+import orjson
 import structlog
 import uvicorn
 
@@ -22,7 +23,7 @@ from app.core.config import get_settings
 from app.core.logging_config import setup_logging
 from app.core.exceptions import setup_exception_handlers
 from app.api.v1.router import api_router
-from app.db.session import get_db
+from app.db.session import get_db, init_db, close_db
 from app.services.rust_bridge import RustGeometryService
 from app.services.neo4j_service import init_neo4j, close_neo4j, get_neo4j_service
 
@@ -51,6 +52,9 @@ async def lifespan(app: FastAPI):
     else:
         logger.warning("Neo4j connection failed - graph features disabled")
     
+    # Initialize database session
+    await init_db()
+    
     # Health check endpoints will verify database connections
     logger.info("NERV API startup complete")
     
@@ -61,6 +65,9 @@ async def lifespan(app: FastAPI):
     
     # Close Neo4j connection
     await close_neo4j()
+    
+    # Close database session
+    await close_db()
 
 # Create FastAPI application
 app = FastAPI(
@@ -86,6 +93,7 @@ app = FastAPI(
     version=settings.version,
     docs_url="/docs" if settings.environment == "development" else None,
     redoc_url="/redoc" if settings.environment == "development" else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -94,28 +102,40 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.allowed_hosts,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
+    # CORS-safelisted headers such as Accept are always allowed; these are
+    # the others clients send (If-None-Match revalidates cached MAGI content)
+    allow_headers=["Authorization", "Content-Type", "X-Requested-With", "If-None-Match"],
 )
 
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Graph and construction payloads are repetitive JSON and compress well;
+# a mid compression level keeps CPU cost per response low
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.gzip_minimum_size,
+    compresslevel=settings.gzip_compress_level
+)
+
+# Successful requests are only logged when debugging; errors always are
+_LOG_ALL_REQUESTS = settings.log_level == "DEBUG"
 
 # Add request timing middleware
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
+    process_time = (time.perf_counter_ns() - start_ns) / 1_000_000_000
+    response.headers["X-Process-Time"] = f"{process_time:.6f}"
     
     # Log request
-    logger.info(
-        "Request processed",
-        method=request.method,
-        url=str(request.url),
-        status_code=response.status_code,
-        process_time=process_time
-    )
+    if _LOG_ALL_REQUESTS or response.status_code >= 400:
+        logger.info(
+            "Request processed",
+            method=request.method,
+            url=str(request.url),
+            status_code=response.status_code,
+            process_time=process_time
+        )
     
     return response
 
@@ -126,15 +146,29 @@ setup_exception_handlers(app)
 app.include_router(api_router, prefix="/api/v1")
 
 # Health check endpoints
-@app.get("/health")
-async def health_check() -> Dict[str, Any]:
+# Serialized /health body and the monotonic time it expires. Liveness
+# probes hit /health constantly, so the body is rebuilt at most once a
+# second.
+_HEALTH_BODY_TTL_SECONDS = 1.0
+_health_body: bytes = b""
+_health_body_expires_at = 0.0
+
+@app.get("/health", response_model=Dict[str, Any])
+async def health_check() -> Response:
     """Basic health check endpoint."""
-    return {
-        "status": "healthy",
-        "service": "nerv-geometry-api",
-        "version": settings.version,
-        "timestamp": time.time()
-    }
+    global _health_body, _health_body_expires_at
+    
+    now = time.monotonic()
+    if now >= _health_body_expires_at:
+        _health_body = orjson.dumps({
+            "status": "healthy",
+            "service": "nerv-geometry-api",
+            "version": settings.version,
+            "timestamp": time.time()
+        })
+        _health_body_expires_at = now + _HEALTH_BODY_TTL_SECONDS
+    
+    return Response(content=_health_body, media_type="application/json")
 
 @app.get("/health/detailed")
 async def detailed_health_check() -> Dict[str, Any]:
@@ -193,17 +227,20 @@ async def detailed_health_check() -> Dict[str, Any]:
         
     return health_status
 
+# The API information never changes while the process runs
+_ROOT_BODY = orjson.dumps({
+    "service": "NERV Geometry Engine API",
+    "version": settings.version,
+    "description": "Industrial-grade gamified Euclidean geometry construction system",
+    "docs": "/docs",
+    "health": "/health",
+    "api": "/api/v1"
+})
+
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
-    return {
-        "service": "NERV Geometry Engine API",
-        "version": settings.version,
-        "description": "Industrial-grade gamified Euclidean geometry construction system",
-        "docs": "/docs",
-        "health": "/health",
-        "api": "/api/v1"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 if __name__ == "__main__":
     uvicorn.run(
@@ -211,5 +248,8 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=settings.environment == "development",
+        # uvloop where installed (it is not on Windows), asyncio otherwise
+        loop="auto",
+        http="httptools",
         log_config=None  # Use our custom logging config
     )
\ No newline at end of file
@@ -248,6 +248,19 @@ class CypherQueries:
         RETURN p
     """
     
+    CREATE_POINTS_BULK = """
+        UNWIND $points AS point
+        CREATE (p:Point:GeometricObject {
+            node_id: point.node_id,
+            x: point.x,
+            y: point.y,
+            label: point.label,
+            is_constructed: point.is_constructed,
+            created_at: datetime()
+        })
+        RETURN p.node_id as node_id
+    """
+    
     CREATE_LINE = """
         CREATE (l:Line:GeometricObject {
             node_id: $node_id,
@@ -301,6 +314,19 @@ class CypherQueries:
                labels(obj2) as object_types
     """
     
+    GET_OBJECT_RELATIONSHIPS = """
+        MATCH (obj:GeometricObject {node_id: $object_id})-[r]-(related)
+        WHERE size($types) = 0 OR type(r) IN $types
+        RETURN 
+            type(r) as relationship_type,
+            related.node_id as related_id,
+            labels(related) as related_labels,
+            r as relationship_properties,
+            CASE WHEN size($fields) = 0 THEN related
+                 ELSE [key IN $fields | related[key]] END as related_object
+        ORDER BY type(r), related.created_at
+    """
+    
     # Construction queries
     FIND_CONSTRUCTION_DEPENDENCIES = """
         MATCH (c:Construction {node_id: $construction_id})-[:DEPENDS_ON]->(obj:GeometricObject)
@@ -355,25 +381,78 @@ class CypherQueries:
         RETURN t2.node_id as theorem_id, t2.name as name, t2.statement as statement
         ORDER BY t2.name
     """
+    
+    # Statistics queries (served from the store's count metadata, no scans)
+    GRAPH_STATS_APOC = """
+        CALL apoc.meta.stats() YIELD labels, relTypesCount
+        RETURN labels, relTypesCount
+    """
+    
+    LIST_LABELS = """
+        CALL db.labels() YIELD label
+        RETURN collect(label) as labels
+    """
+    
+    LIST_RELATIONSHIP_TYPES = """
+        CALL db.relationshipTypes() YIELD relationshipType
+        RETURN collect(relationshipType) as types
+    """
+    
+    # Construction similarity queries
+    GET_CONSTRUCTION_STRUCTURE = """
+        MATCH (c:Construction {node_id: $construction_id})-[:CREATED_BY|DEPENDS_ON]-(obj:GeometricObject)
+        WITH collect(DISTINCT obj) as objects
+        UNWIND objects as a
+        OPTIONAL MATCH (a)-[r:LIES_ON|CONTAINS|INTERSECTS]->(b:GeometricObject)
+        WHERE b IN objects
+        WITH objects, collect(CASE WHEN r IS NULL THEN null ELSE [labels(a), type(r), labels(b)] END) as relationships
+        RETURN [obj IN objects | labels(obj)] as object_labels, relationships
+    """
+    
+    SET_CONSTRUCTION_EMBEDDING = """
+        MATCH (c:Construction {node_id: $construction_id})
+        SET c.embedding = $embedding
+    """
+    
+    FIND_SIMILAR_CONSTRUCTIONS_ANN = """
+        MATCH (c:Construction {node_id: $construction_id})
+        WHERE c.embedding IS NOT NULL
+        CALL db.index.vector.queryNodes('construction_embedding', $candidates, c.embedding)
+        YIELD node, score
+        WITH node, score
+        WHERE node.node_id <> $construction_id
+        RETURN node.node_id as construction_id,
+               node.name as name,
+               node.description as description,
+               score as similarity
+        ORDER BY similarity DESC
+        LIMIT $limit
+    """
+
+
+# Length of the structural embedding stored on Construction nodes
+CONSTRUCTION_EMBEDDING_DIMENSIONS = 128
 
 
 # Graph database schema constraints and indexes
 GRAPH_SCHEMA = {
+    # Every node label is looked up by node_id; a uniqueness constraint
+    # gives each one a backing index
     "constraints": [
-        "CREATE CONSTRAINT point_id_unique IF NOT EXISTS FOR (p:Point) REQUIRE p.node_id IS UNIQUE",
-        "CREATE CONSTRAINT line_id_unique IF NOT EXISTS FOR (l:Line) REQUIRE l.node_id IS UNIQUE", 
-        "CREATE CONSTRAINT circle_id_unique IF NOT EXISTS FOR (c:Circle) REQUIRE c.node_id IS UNIQUE",
-        "CREATE CONSTRAINT construction_id_unique IF NOT EXISTS FOR (c:Construction) REQUIRE c.node_id IS UNIQUE",
-        "CREATE CONSTRAINT player_id_unique IF NOT EXISTS FOR (p:Player) REQUIRE p.node_id IS UNIQUE",
-        "CREATE CONSTRAINT element_id_unique IF NOT EXISTS FOR (e:Element) REQUIRE e.node_id IS UNIQUE",
-        "CREATE CONSTRAINT theorem_id_unique IF NOT EXISTS FOR (t:Theorem) REQUIRE t.node_id IS UNIQUE"
+        f"CREATE CONSTRAINT {node_type.value.lower()}_id_unique IF NOT EXISTS "
+        f"FOR (n:{node_type.value}) REQUIRE n.node_id IS UNIQUE"
+        for node_type in NodeType
     ],
     "indexes": [
         "CREATE INDEX point_coordinates IF NOT EXISTS FOR (p:Point) ON (p.x, p.y)",
         "CREATE INDEX geometric_objects IF NOT EXISTS FOR (obj:GeometricObject) ON obj.created_at",
+        "CREATE INDEX geometric_object_id IF NOT EXISTS FOR (obj:GeometricObject) ON obj.node_id",
         "CREATE INDEX player_username IF NOT EXISTS FOR (p:Player) ON p.username",
         "CREATE INDEX element_rarity IF NOT EXISTS FOR (e:Element) ON e.rarity",
         "CREATE INDEX construction_player IF NOT EXISTS FOR (c:Construction) ON c.player_id",
-        "CREATE INDEX theorem_category IF NOT EXISTS FOR (t:Theorem) ON t.category"
+        "CREATE INDEX theorem_category IF NOT EXISTS FOR (t:Theorem) ON t.category",
+        "CREATE VECTOR INDEX construction_embedding IF NOT EXISTS FOR (c:Construction) ON c.embedding "
+        f"OPTIONS {{indexConfig: {{`vector.dimensions`: {CONSTRUCTION_EMBEDDING_DIMENSIONS}, "
+        "`vector.similarity_function`: 'cosine'}}"
     ]
 }
\ No newline at end of file
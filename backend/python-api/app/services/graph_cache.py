@@ -0,0 +1,88 @@
+"""
+Graph Read Cache
+
+Short-lived LRU cache for graph read endpoints, so repeated reads of the
+same construction, player or statistics skip the Neo4j round-trip.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire a fixed time after being set.
+
+    Keys are tuples whose first item names the cached query, so related
+    entries can be dropped together by key prefix.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl_seconds: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Any]:
+        """Return the cached value for a key, or None if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+
+        self.misses += 1
+        return None
+
+    def set(self, key: Tuple[Hashable, ...], value: Any) -> None:
+        """Cache a value, evicting the least recently used entries if full."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *prefix: Hashable) -> int:
+        """Drop every entry whose key starts with the given items."""
+        size = len(prefix)
+        stale = [key for key in self._entries if key[:size] == prefix]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> int:
+        """Drop every entry and return how many there were."""
+        count = len(self._entries)
+        self._entries.clear()
+        return count
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size and hit statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+
+# Global cache instance for graph read endpoints
+graph_cache = TTLCache(
+    maxsize=settings.graph_cache_max_entries,
+    ttl_seconds=settings.graph_cache_ttl_seconds
+)
+
+
+async def get_graph_cache() -> TTLCache:
+    """Get the graph read cache instance."""
+    return graph_cache
@@ -6,12 +6,16 @@ for storing and querying geometric relationships, constructions, and proofs.
 """
 
 import asyncio
-from typing import Dict, List, Optional, Any, Tuple, Union
+import math
+import time
+import zlib
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
 import json
 
-from neo4j import AsyncGraphDatabase, AsyncSession, Record
-from neo4j.exceptions import ServiceUnavailable, TransientError
+from neo4j import AsyncGraphDatabase, AsyncSession, Record, READ_ACCESS, WRITE_ACCESS
+from neo4j.exceptions import ClientError, ServiceUnavailable, TransientError
+from neo4j.graph import Entity
 import structlog
 
 from app.core.config import get_settings
@@ -19,7 +23,7 @@ from app.models.graph import (
     GraphNode, GraphRelationship, GraphQuery, GraphResult,
     GeometricPoint, GeometricLine, GeometricCircle, Construction,
     Player, Element, Theorem, NodeType, RelationshipType,
-    CypherQueries, GRAPH_SCHEMA
+    CypherQueries, GRAPH_SCHEMA, CONSTRUCTION_EMBEDDING_DIMENSIONS
 )
 
 logger = structlog.get_logger()
@@ -35,16 +39,26 @@ class Neo4jService:
         self.user = settings.neo4j_user or "neo4j"
         self.password = settings.neo4j_password or "password"
         self.database = settings.neo4j_database or "neo4j"
-        self.connection_pool_size = 50
-        self.max_connection_lifetime = 3600  # 1 hour
+        self.connection_pool_size = settings.neo4j_max_connection_pool_size
+        self.connection_acquisition_timeout = settings.neo4j_connection_acquisition_timeout
+        self.max_connection_lifetime = settings.neo4j_max_connection_lifetime
+        self._apoc_available: Optional[bool] = None
         
     async def connect(self) -> bool:
-        """Initialize connection to Neo4j database."""
+        """Initialize connection to Neo4j database.
+        
+        The driver and its connection pool are shared by every request for
+        the life of the process; calling this again reuses them.
+        """
+        if self.driver is not None:
+            return True
+        
         try:
             self.driver = AsyncGraphDatabase.driver(
                 self.uri,
                 auth=(self.user, self.password),
                 max_connection_pool_size=self.connection_pool_size,
+                connection_acquisition_timeout=self.connection_acquisition_timeout,
                 max_connection_lifetime=self.max_connection_lifetime,
                 encrypted=False  # Use True in production with certificates
             )
@@ -60,12 +74,16 @@ class Neo4jService:
             
         except Exception as e:
             logger.error("Failed to connect to Neo4j", error=str(e), uri=self.uri)
+            if self.driver is not None:
+                await self.driver.close()
+                self.driver = None
             return False
     
     async def disconnect(self):
         """Close connection to Neo4j database."""
         if self.driver:
             await self.driver.close()
+            self.driver = None
             logger.info("Neo4j connection closed")
     
     async def health_check(self) -> Dict[str, Any]:
@@ -74,25 +92,20 @@ class Neo4jService:
             if not self.driver:
                 return {"status": "disconnected", "error": "No driver initialized"}
             
-            async with self.driver.session(database=self.database) as session:
-                result = await session.run("RETURN 1 as health_check")
-                record = await result.single()
-                
-                if record and record["health_check"] == 1:
-                    # Get database info
-                    db_info = await session.run(
-                        "CALL dbms.components() YIELD name, versions, edition"
-                    )
-                    components = [dict(record) async for record in db_info]
-                    
-                    return {
-                        "status": "healthy",
-                        "database": self.database,
-                        "components": components,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                else:
-                    return {"status": "unhealthy", "error": "Health check query failed"}
+            # Fetching server info verifies connectivity over a pooled
+            # connection without running a query
+            server_info = await self.driver.get_server_info()
+            
+            return {
+                "status": "healthy",
+                "database": self.database,
+                "server": {
+                    "agent": server_info.agent,
+                    "protocol_version": ".".join(map(str, server_info.protocol_version)),
+                    "address": str(server_info.address)
+                },
+                "timestamp": datetime.now().isoformat()
+            }
                     
         except Exception as e:
             logger.error("Neo4j health check failed", error=str(e))
@@ -123,29 +136,25 @@ class Neo4jService:
         except Exception as e:
             logger.error("Schema initialization failed", error=str(e))
     
-    async def execute_query(self, query: GraphQuery) -> GraphResult:
-        """Execute a Cypher query and return results."""
-        start_time = datetime.now()
+    async def execute_query(self, query: GraphQuery, access_mode: str = WRITE_ACCESS) -> GraphResult:
+        """Execute a Cypher query and return results.
+        
+        Pass READ_ACCESS for read-only queries so a cluster can route them
+        to followers instead of the leader.
+        """
+        start_time = time.perf_counter()
         
         try:
-            async with self.driver.session(database=self.database) as session:
+            async with self.driver.session(database=self.database, default_access_mode=access_mode) as session:
                 result = await session.run(query.cypher, query.parameters)
                 
                 records = []
                 async for record in result:
-                    # Convert Neo4j record to dictionary
-                    record_dict = {}
-                    for key in record.keys():
-                        value = record[key]
-                        # Handle Neo4j specific types
-                        if hasattr(value, '__dict__'):
-                            record_dict[key] = dict(value)
-                        else:
-                            record_dict[key] = value
-                    records.append(record_dict)
+                    # Convert Neo4j record to a JSON-ready dictionary
+                    records.append({key: _to_plain(value) for key, value in record.items()})
                 
                 summary = await result.consume()
-                execution_time = (datetime.now() - start_time).total_seconds()
+                execution_time = time.perf_counter() - start_time
                 
                 logger.info(
                     "Neo4j query executed",
@@ -169,6 +178,22 @@ class Neo4jService:
             logger.error("Neo4j query execution failed", query=query.cypher, error=str(e))
             raise
     
+    async def stream_query(
+        self,
+        query: GraphQuery,
+        access_mode: str = READ_ACCESS
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Execute a Cypher query and yield records as the driver receives them.
+        
+        Unlike execute_query, records are not collected into a list, so
+        memory stays flat for large results. The session stays open until
+        the iterator is exhausted or closed.
+        """
+        async with self.driver.session(database=self.database, default_access_mode=access_mode) as session:
+            result = await session.run(query.cypher, query.parameters)
+            async for record in result:
+                yield {key: _to_plain(value) for key, value in record.items()}
+    
     # Geometric object operations
     
     async def create_point(self, point: GeometricPoint) -> GraphResult:
@@ -185,6 +210,21 @@ class Neo4jService:
         )
         return await self.execute_query(query)
     
+    async def create_points(self, points: List[Dict[str, Any]]) -> List[str]:
+        """Create many point nodes in one query and return their IDs.
+        
+        Each point is a dict with node_id, x, y, label and is_constructed.
+        """
+        if not points:
+            return []
+        
+        query = GraphQuery(
+            cypher=CypherQueries.CREATE_POINTS_BULK,
+            parameters={"points": points}
+        )
+        result = await self.execute_query(query)
+        return [record["node_id"] for record in result.records]
+    
     async def create_line(self, line: GeometricLine) -> GraphResult:
         """Create a line node in the graph."""
         query = GraphQuery(
@@ -250,7 +290,7 @@ class Neo4jService:
             cypher=CypherQueries.FIND_INTERSECTIONS,
             parameters={"obj1_id": obj1_id}
         )
-        result = await self.execute_query(query)
+        result = await self.execute_query(query, access_mode=READ_ACCESS)
         
         intersections = []
         for record in result.records:
@@ -304,16 +344,51 @@ class Neo4jService:
         return await self.execute_query(query)
     
     async def link_construction_objects(self, construction_id: str, object_ids: List[str], relationship_type: str):
-        """Link construction with geometric objects it creates or depends on."""
-        for object_id in object_ids:
-            query = GraphQuery(
-                cypher=f"""
-                    MATCH (c:Construction {{node_id: $construction_id}}), (obj:GeometricObject {{node_id: $object_id}})
-                    CREATE (obj)-[:{relationship_type} {{created_at: datetime()}}]->(c)
-                """,
-                parameters={"construction_id": construction_id, "object_id": object_id}
-            )
-            await self.execute_query(query)
+        """Link construction with geometric objects it creates or depends on.
+        
+        All objects are linked by one UNWIND query. Relationship types cannot
+        be query parameters, so the type is checked against RelationshipType
+        before it is placed in the Cypher text.
+        """
+        if relationship_type not in RelationshipType.__members__:
+            raise ValueError(f"Unknown relationship type: {relationship_type}")
+        if not object_ids:
+            return
+            
+        query = GraphQuery(
+            cypher=f"""
+                MATCH (c:Construction {{node_id: $construction_id}})
+                UNWIND $object_ids AS object_id
+                MATCH (obj:GeometricObject {{node_id: object_id}})
+                MERGE (obj)-[r:{relationship_type}]->(c)
+                ON CREATE SET r.created_at = datetime()
+            """,
+            parameters={"construction_id": construction_id, "object_ids": object_ids}
+        )
+        await self.execute_query(query)
+        await self.update_construction_embedding(construction_id)
+    
+    async def update_construction_embedding(self, construction_id: str) -> Optional[List[float]]:
+        """Recompute and store the structural embedding of a construction.
+        
+        Returns the embedding, or None if the construction has no objects.
+        """
+        query = GraphQuery(
+            cypher=CypherQueries.GET_CONSTRUCTION_STRUCTURE,
+            parameters={"construction_id": construction_id}
+        )
+        # Read with write routing so the objects just linked are visible
+        result = await self.execute_query(query)
+        if not result.records:
+            return None
+        
+        record = result.records[0]
+        embedding = _structure_embedding(record["object_labels"], record["relationships"])
+        await self.execute_query(GraphQuery(
+            cypher=CypherQueries.SET_CONSTRUCTION_EMBEDDING,
+            parameters={"construction_id": construction_id, "embedding": embedding}
+        ))
+        return embedding
     
     async def get_construction_objects(self, construction_id: str) -> List[Dict[str, Any]]:
         """Get all objects created by or used in a construction."""
@@ -321,7 +396,7 @@ class Neo4jService:
             cypher=CypherQueries.FIND_OBJECTS_IN_CONSTRUCTION,
             parameters={"construction_id": construction_id}
         )
-        result = await self.execute_query(query)
+        result = await self.execute_query(query, access_mode=READ_ACCESS)
         return result.records
     
     # Player and collection operations
@@ -358,7 +433,7 @@ class Neo4jService:
             cypher=CypherQueries.GET_PLAYER_ELEMENTS,
             parameters={"player_id": player_id}
         )
-        result = await self.execute_query(query)
+        result = await self.execute_query(query, access_mode=READ_ACCESS)
         return result.records
     
     async def unlock_element(self, player_id: str, element_id: str) -> GraphResult:
@@ -381,13 +456,25 @@ class Neo4jService:
             cypher=CypherQueries.FIND_UNLOCKABLE_ELEMENTS,
             parameters={"player_id": player_id}
         )
-        result = await self.execute_query(query)
+        result = await self.execute_query(query, access_mode=READ_ACCESS)
         return result.records
     
     # Advanced graph analysis
     
     async def find_similar_constructions(self, construction_id: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Find constructions similar to the given one based on structure."""
+        """Find constructions similar to the given one based on structure.
+        
+        Uses the construction_embedding vector index when the construction
+        has an embedding, and falls back to comparing object types across
+        every construction otherwise.
+        """
+        try:
+            similar = await self.find_similar_constructions_ann(construction_id, limit)
+            if similar:
+                return similar
+        except ClientError as e:
+            logger.warning("Vector similarity search unavailable", error=str(e))
+        
         query = GraphQuery(
             cypher="""
                 MATCH (c1:Construction {node_id: $construction_id})-[:CREATED_BY|DEPENDS_ON]-(obj1:GeometricObject)
@@ -413,7 +500,21 @@ class Neo4jService:
             """,
             parameters={"construction_id": construction_id, "limit": limit}
         )
-        result = await self.execute_query(query)
+        result = await self.execute_query(query, access_mode=READ_ACCESS)
+        return result.records
+    
+    async def find_similar_constructions_ann(self, construction_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Find similar constructions by nearest-neighbour search on embeddings."""
+        query = GraphQuery(
+            cypher=CypherQueries.FIND_SIMILAR_CONSTRUCTIONS_ANN,
+            parameters={
+                "construction_id": construction_id,
+                # The construction itself is its own nearest neighbour
+                "candidates": limit + 1,
+                "limit": limit
+            }
+        )
+        result = await self.execute_query(query, access_mode=READ_ACCESS)
         return result.records
     
     async def analyze_construction_patterns(self, player_id: Optional[str] = None) -> Dict[str, Any]:
@@ -441,7 +542,7 @@ class Neo4jService:
             cypher=cypher,
             parameters={"player_id": player_id} if player_id else {}
         )
-        result = await self.execute_query(query)
+        result = await self.execute_query(query, access_mode=READ_ACCESS)
         
         return {
             "patterns": result.records,
@@ -449,35 +550,192 @@ class Neo4jService:
             "analysis_timestamp": datetime.now().isoformat()
         }
     
-    async def get_construction_graph(self, construction_id: str) -> Dict[str, Any]:
-        """Get the complete graph structure for a construction."""
+    async def get_construction_graph(
+        self,
+        construction_id: str,
+        fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Get the complete graph structure for a construction.
+        
+        If fields are given, nodes are returned with only those properties.
+        """
         query = GraphQuery(
-            cypher="""
-                MATCH (c:Construction {node_id: $construction_id})
-                OPTIONAL MATCH (c)-[r1:CREATED_BY|DEPENDS_ON]-(obj:GeometricObject)
-                OPTIONAL MATCH (obj)-[r2:LIES_ON|CONTAINS|INTERSECTS]-(related:GeometricObject)
-                
-                RETURN c,
-                       collect(DISTINCT obj) as objects,
-                       collect(DISTINCT r1) as construction_relationships,
-                       collect(DISTINCT r2) as geometric_relationships,
-                       collect(DISTINCT related) as related_objects
-            """,
-            parameters={"construction_id": construction_id}
+            cypher=_CONSTRUCTION_GRAPH_CYPHER,
+            parameters={"construction_id": construction_id, "fields": fields or []}
         )
-        result = await self.execute_query(query)
+        result = await self.execute_query(query, access_mode=READ_ACCESS)
         
         if result.records:
             record = result.records[0]
             return {
-                "construction": record.get("c", {}),
-                "objects": record.get("objects", []),
+                "construction": project_node(record.get("c", {}), fields),
+                "objects": project_nodes(record.get("objects", []), fields),
                 "construction_relationships": record.get("construction_relationships", []),
                 "geometric_relationships": record.get("geometric_relationships", []),
-                "related_objects": record.get("related_objects", [])
+                "related_objects": project_nodes(record.get("related_objects", []), fields)
             }
         
         return {}
+    
+    # Statistics
+    
+    async def get_graph_statistics(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get node counts per label and relationship counts per type.
+        
+        Uses apoc.meta.stats() when APOC is installed, otherwise counts each
+        label and relationship type from the catalog. Both read the store's
+        count metadata instead of scanning the graph.
+        """
+        if self._apoc_available is not False:
+            try:
+                result = await self.execute_query(
+                    GraphQuery(cypher=CypherQueries.GRAPH_STATS_APOC), access_mode=READ_ACCESS
+                )
+                self._apoc_available = True
+                record = result.records[0] if result.records else {}
+                return {
+                    "nodes": [
+                        {"label": label, "count": count}
+                        for label, count in (record.get("labels") or {}).items()
+                    ],
+                    "relationships": [
+                        {"type": rel_type, "count": count}
+                        for rel_type, count in (record.get("relTypesCount") or {}).items()
+                    ]
+                }
+            except ClientError as e:
+                logger.info("APOC unavailable, counting from label catalog", error=str(e))
+                self._apoc_available = False
+        
+        # Catalog lookups and the count queries each run concurrently
+        labels_result, types_result = await asyncio.gather(
+            self.execute_query(GraphQuery(cypher=CypherQueries.LIST_LABELS), access_mode=READ_ACCESS),
+            self.execute_query(GraphQuery(cypher=CypherQueries.LIST_RELATIONSHIP_TYPES), access_mode=READ_ACCESS)
+        )
+        labels = labels_result.records[0]["labels"] if labels_result.records else []
+        rel_types = types_result.records[0]["types"] if types_result.records else []
+        
+        node_counts, relationship_counts = await asyncio.gather(
+            self._count_by_name(labels, "MATCH (:{name})", "label"),
+            self._count_by_name(rel_types, "MATCH ()-[:{name}]->()", "type")
+        )
+        return {"nodes": node_counts, "relationships": relationship_counts}
+    
+    async def _count_by_name(self, names: List[str], pattern: str, key: str) -> List[Dict[str, Any]]:
+        """Count matches of a pattern for each label or relationship type.
+        
+        Single-label and single-type counts are answered from the count store.
+        """
+        if not names:
+            return []
+        
+        counts = [
+            f"{pattern.format(name=_escape_name(name))} RETURN $name_{i} as {key}, count(*) as count"
+            for i, name in enumerate(names)
+        ]
+        result = await self.execute_query(GraphQuery(
+            cypher="\nUNION ALL\n".join(counts),
+            parameters={f"name_{i}": name for i, name in enumerate(names)}
+        ), access_mode=READ_ACCESS)
+        return result.records
+
+def _to_plain(value: Any) -> Any:
+    """Convert driver values into plain Python values that serialize as JSON.
+    
+    Nodes and relationships become property dicts (including inside
+    collected lists), and temporal values become ISO 8601 strings.
+    """
+    if isinstance(value, Entity):
+        return {key: _to_plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_to_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_plain(item) for key, item in value.items()}
+    if hasattr(value, "iso_format"):
+        return value.iso_format()
+    return value
+
+
+def projection_fields(fields: Optional[List[str]]) -> List[str]:
+    """Normalize a requested field list; node_id is always included first."""
+    if not fields:
+        return []
+    return ["node_id"] + [field for field in dict.fromkeys(fields) if field != "node_id"]
+
+
+def node_projection(variable: str) -> str:
+    """Cypher expression for a node, or the values of its $fields if any.
+    
+    The field names stay a query parameter, so the query text (and its
+    cached plan) is the same whatever fields are requested.
+    """
+    return (
+        f"CASE WHEN {variable} IS NULL OR size($fields) = 0 THEN {variable} "
+        f"ELSE [key IN $fields | {variable}[key]] END"
+    )
+
+
+# Built once: the projected fields are a parameter, not part of the text
+_CONSTRUCTION_GRAPH_CYPHER = f"""
+    MATCH (c:Construction {{node_id: $construction_id}})
+    OPTIONAL MATCH (c)-[r1:CREATED_BY|DEPENDS_ON]-(obj:GeometricObject)
+    OPTIONAL MATCH (obj)-[r2:LIES_ON|CONTAINS|INTERSECTS]-(related:GeometricObject)
+    
+    RETURN {node_projection("c")} as c,
+           collect(DISTINCT {node_projection("obj")}) as objects,
+           collect(DISTINCT r1) as construction_relationships,
+           collect(DISTINCT r2) as geometric_relationships,
+           collect(DISTINCT {node_projection("related")}) as related_objects
+"""
+
+
+def project_node(value: Any, fields: Optional[List[str]]) -> Any:
+    """Rebuild a node dict from the field values returned by node_projection."""
+    if not fields or not isinstance(value, list):
+        return value
+    return dict(zip(fields, value))
+
+
+def project_nodes(values: List[Any], fields: Optional[List[str]]) -> List[Any]:
+    """Rebuild a list of nodes returned by node_projection."""
+    if not fields:
+        return values
+    return [project_node(value, fields) for value in values]
+
+
+def _object_type(labels: List[str]) -> str:
+    """Return the specific label of a geometric object node."""
+    return next((label for label in labels if label != "GeometricObject"), "GeometricObject")
+
+
+def _structure_embedding(
+    object_labels: List[List[str]],
+    relationships: List[List[Any]]
+) -> List[float]:
+    """Embed a construction's structure as a unit-length feature vector.
+    
+    Counts object types and typed relationships between objects (for
+    example "Point-LIES_ON-Line"), hashes each feature into a fixed-size
+    vector and normalizes it, so cosine similarity compares constructions
+    by the shapes they use and how those shapes relate.
+    """
+    vector = [0.0] * CONSTRUCTION_EMBEDDING_DIMENSIONS
+    features = [_object_type(labels) for labels in object_labels]
+    features.extend(
+        f"{_object_type(start)}-{rel_type}-{_object_type(end)}"
+        for start, rel_type, end in relationships
+    )
+    for feature in features:
+        # crc32 rather than hash(), which is salted per process
+        vector[zlib.crc32(feature.encode()) % CONSTRUCTION_EMBEDDING_DIMENSIONS] += 1.0
+    
+    norm = math.sqrt(sum(value * value for value in vector))
+    return [value / norm for value in vector] if norm else vector
+
+
+def _escape_name(name: str) -> str:
+    """Backtick-quote a label or relationship type for use in Cypher."""
+    return "`" + name.replace("`", "``") + "`"
 
 
 # Global Neo4j service instance
@@ -6,14 +6,14 @@ ctypes bindings or subprocess calls, depending on availability.
 """
 
 import asyncio
-import json
 import subprocess
 import sys
 from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
 
+import orjson
 import structlog
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, PrivateAttr, TypeAdapter
 
 from app.core.config import get_settings
 from app.core.exceptions import GeometryEngineError
@@ -24,6 +24,8 @@ settings = get_settings()
 
 class Point(BaseModel):
     """Geometric point representation."""
+    model_config = ConfigDict(frozen=True)
+    
     id: str
     x: float
     y: float
@@ -32,8 +34,14 @@ class Point(BaseModel):
     dependencies: List[str] = []
 
 
+# Dumps a whole list of points, such as intersection results, in one pass
+POINT_LIST_ADAPTER = TypeAdapter(List[Point])
+
+
 class Line(BaseModel):
     """Geometric line representation."""
+    model_config = ConfigDict(frozen=True)
+    
     id: str
     point1_id: str
     point2_id: str
@@ -43,6 +51,8 @@ class Line(BaseModel):
 
 class Circle(BaseModel):
     """Geometric circle representation."""
+    model_config = ConfigDict(frozen=True)
+    
     id: str
     center_id: str
     radius_point_id: str
@@ -51,11 +61,69 @@ class Circle(BaseModel):
 
 
 class ConstructionSpace(BaseModel):
-    """Complete construction space state."""
+    """Complete construction space state.
+    
+    Points, lines and circles are immutable, so the space only changes
+    through its containers, which bump the version via mark_modified().
+    """
     points: Dict[str, Point] = {}
     lines: Dict[str, Line] = {}
     circles: Dict[str, Circle] = {}
     history: List[Dict[str, Any]] = []
+    
+    # Serialized form reused across engine calls until the space changes
+    _version: int = PrivateAttr(default=0)
+    _serialized: Optional[tuple[int, Dict[str, Any]]] = PrivateAttr(default=None)
+    _object_ids: Optional[tuple[int, frozenset]] = PrivateAttr(default=None)
+    
+    def mark_modified(self) -> None:
+        """Record an in-place change so the cached serialization is rebuilt."""
+        self._version += 1
+    
+    def to_engine_dict(self) -> Dict[str, Any]:
+        """Return the engine payload for this space, cached per version."""
+        if self._serialized is None or self._serialized[0] != self._version:
+            self._serialized = (self._version, self.model_dump())
+        return self._serialized[1]
+    
+    def object_ids(self) -> frozenset:
+        """Return the ids of all points, lines and circles, cached per version."""
+        if self._object_ids is None or self._object_ids[0] != self._version:
+            self._object_ids = (
+                self._version,
+                frozenset(self.points.keys() | self.lines.keys() | self.circles.keys())
+            )
+        return self._object_ids[1]
+
+
+_ENGINE_OBJECT_MODELS = {"points": Point, "lines": Line, "circles": Circle}
+
+
+def _merge_engine_result(
+    construction_space: ConstructionSpace,
+    engine_space: Dict[str, Any],
+    collection: str,
+    object_id: str
+) -> ConstructionSpace:
+    """Merge the object an engine command created into the given space.
+    
+    Only the new object and new history entries are taken from the engine's
+    copy, so objects it does not echo back are never dropped from the
+    caller's space. The engine history either repeats the existing entries
+    or holds just the new ones.
+    """
+    model = _ENGINE_OBJECT_MODELS[collection]
+    getattr(construction_space, collection)[object_id] = model(
+        **engine_space[collection][object_id]
+    )
+    history = construction_space.history
+    engine_history = engine_space.get("history", [])
+    known = len(history)
+    if known and len(engine_history) >= known and engine_history[known - 1] == history[-1]:
+        engine_history = engine_history[known:]
+    history.extend(engine_history)
+    construction_space.mark_modified()
+    return construction_space
 
 
 class RustGeometryService:
@@ -134,19 +202,22 @@ class RustGeometryService:
             point_id = str(uuid.uuid4())
             point = Point(id=point_id, x=x, y=y, label=label)
             construction_space.points[point_id] = point
+            construction_space.mark_modified()
             return point_id, construction_space
             
         try:
             result = await self._execute_rust_command({
                 "command": "add_point",
-                "construction_space": construction_space.dict(),
+                "construction_space": construction_space.to_engine_dict(),
                 "x": x,
                 "y": y,
                 "label": label
             })
             
-            updated_space = ConstructionSpace(**result["construction_space"])
-            return result["point_id"], updated_space
+            point_id = result["point_id"]
+            return point_id, _merge_engine_result(
+                construction_space, result["construction_space"], "points", point_id
+            )
             
         except Exception as e:
             raise GeometryEngineError(f"Failed to add point: {str(e)}")
@@ -180,19 +251,22 @@ class RustGeometryService:
                 dependencies=[point1_id, point2_id]
             )
             construction_space.lines[line_id] = line
+            construction_space.mark_modified()
             return line_id, construction_space
             
         try:
             result = await self._execute_rust_command({
                 "command": "construct_line",
-                "construction_space": construction_space.dict(),
+                "construction_space": construction_space.to_engine_dict(),
                 "point1_id": point1_id,
                 "point2_id": point2_id,
                 "label": label
             })
             
-            updated_space = ConstructionSpace(**result["construction_space"])
-            return result["line_id"], updated_space
+            line_id = result["line_id"]
+            return line_id, _merge_engine_result(
+                construction_space, result["construction_space"], "lines", line_id
+            )
             
         except Exception as e:
             raise GeometryEngineError(f"Failed to construct line: {str(e)}")
@@ -226,19 +300,22 @@ class RustGeometryService:
                 dependencies=[center_id, radius_point_id]
             )
             construction_space.circles[circle_id] = circle
+            construction_space.mark_modified()
             return circle_id, construction_space
             
         try:
             result = await self._execute_rust_command({
                 "command": "construct_circle",
-                "construction_space": construction_space.dict(),
+                "construction_space": construction_space.to_engine_dict(),
                 "center_id": center_id,
                 "radius_point_id": radius_point_id,
                 "label": label
             })
             
-            updated_space = ConstructionSpace(**result["construction_space"])
-            return result["circle_id"], updated_space
+            circle_id = result["circle_id"]
+            return circle_id, _merge_engine_result(
+                construction_space, result["construction_space"], "circles", circle_id
+            )
             
         except Exception as e:
             raise GeometryEngineError(f"Failed to construct circle: {str(e)}")
@@ -258,7 +335,7 @@ class RustGeometryService:
         try:
             result = await self._execute_rust_command({
                 "command": "find_intersections",
-                "construction_space": construction_space.dict(),
+                "construction_space": construction_space.to_engine_dict(),
                 "obj1_id": obj1_id,
                 "obj2_id": obj2_id
             })
@@ -278,20 +355,12 @@ class RustGeometryService:
         """Validate if a construction step is valid."""
         
         if not self.rust_binary_path:
-            # Fallback: basic validation
-            step_type = step.get("step_type")
-            if step_type == "add_point":
-                return True
-            elif step_type in ["construct_line", "construct_circle"]:
-                # Check if referenced points exist
-                dependencies = step.get("dependencies", [])
-                return all(dep in construction_space.points for dep in dependencies)
-            return True
+            return self._validate_step_fallback(construction_space, step)
             
         try:
             result = await self._execute_rust_command({
                 "command": "validate_construction",
-                "construction_space": construction_space.dict(),
+                "construction_space": construction_space.to_engine_dict(),
                 "step": step
             })
             
@@ -300,6 +369,91 @@ class RustGeometryService:
         except Exception as e:
             raise GeometryEngineError(f"Failed to validate construction: {str(e)}")
     
+    async def validate_sequence(
+        self,
+        construction_space: ConstructionSpace,
+        steps: List[Dict[str, Any]],
+        stop_on_invalid: bool = True
+    ) -> List[bool]:
+        """Validate a list of construction steps in a single engine call.
+        
+        Returns one result per validated step. With ``stop_on_invalid`` the
+        list ends at the first invalid step.
+        """
+        
+        if not self.rust_binary_path:
+            results = []
+            for step in steps:
+                is_valid = self._validate_step_fallback(construction_space, step)
+                results.append(is_valid)
+                if stop_on_invalid and not is_valid:
+                    break
+            return results
+            
+        try:
+            result = await self._execute_rust_command({
+                "command": "validate_sequence",
+                "construction_space": construction_space.to_engine_dict(),
+                "steps": steps
+            })
+            
+            results = []
+            for step_result in result["results"]:
+                results.append(step_result["is_valid"])
+                if stop_on_invalid and not step_result["is_valid"]:
+                    break
+            return results
+            
+        except Exception as e:
+            raise GeometryEngineError(f"Failed to validate construction sequence: {str(e)}")
+    
+    async def execute_sequence(
+        self,
+        construction_space: ConstructionSpace,
+        steps: List[Dict[str, Any]]
+    ) -> tuple[List[Dict[str, Any]], ConstructionSpace]:
+        """Execute a list of construction steps in a single engine call.
+        
+        The engine keeps the space in memory between steps and stops at the
+        first failing step, returning the results collected so far.
+        """
+        
+        if not self.rust_binary_path:
+            raise GeometryEngineError("Batch execution requires the Rust geometry engine")
+            
+        try:
+            result = await self._execute_rust_command({
+                "command": "execute_sequence",
+                "construction_space": construction_space.to_engine_dict(),
+                "steps": steps
+            })
+            
+            updated_space = ConstructionSpace(**result["construction_space"])
+            return result["results"], updated_space
+            
+        except Exception as e:
+            raise GeometryEngineError(f"Failed to execute construction sequence: {str(e)}")
+    
+    @property
+    def supports_batch_execution(self) -> bool:
+        """Whether whole sequences can be executed in one engine call."""
+        return self.rust_binary_path is not None
+    
+    @staticmethod
+    def _validate_step_fallback(
+        construction_space: ConstructionSpace,
+        step: Dict[str, Any]
+    ) -> bool:
+        """Basic Python validation used when the Rust engine is unavailable."""
+        step_type = step.get("step_type")
+        if step_type == "add_point":
+            return True
+        elif step_type in ["construct_line", "construct_circle"]:
+            # Check if referenced points exist
+            dependencies = step.get("dependencies", [])
+            return all(dep in construction_space.points for dep in dependencies)
+        return True
+    
     async def _execute_rust_command(self, command: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a command using the Rust geometry engine."""
         
@@ -316,21 +470,21 @@ class RustGeometryService:
             )
             
             # Send command as JSON
-            command_json = json.dumps(command).encode()
+            command_json = orjson.dumps(command)
             stdout, stderr = await process.communicate(input=command_json)
             
             if process.returncode != 0:
                 error_msg = stderr.decode() if stderr else "Unknown error"
                 raise GeometryEngineError(f"Rust command failed: {error_msg}")
                 
-            # Parse result
-            result_text = stdout.decode().strip()
-            if not result_text:
+            # Parse result; orjson reads the bytes directly, and surrounding
+            # whitespace is valid JSON
+            if not stdout.strip():
                 raise GeometryEngineError("Empty response from Rust engine")
                 
-            return json.loads(result_text)
+            return orjson.loads(stdout)
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise GeometryEngineError(f"Failed to parse Rust engine response: {str(e)}")
         except Exception as e:
             raise GeometryEngineError(f"Failed to execute Rust command: {str(e)}")
@@ -0,0 +1,101 @@
+"""
+Construction Space Store
+
+Keeps construction spaces on the server so clients that build a
+construction incrementally can refer to it by ID instead of sending the
+whole space with every request.
+"""
+
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from typing import Optional
+
+import structlog
+
+from app.core.config import get_settings
+from app.services.rust_bridge import ConstructionSpace
+
+logger = structlog.get_logger()
+settings = get_settings()
+
+
+class _StoredSpace:
+    """A stored construction space with its expiry time and update lock."""
+
+    __slots__ = ("space", "expires_at", "lock")
+
+    def __init__(self, space: ConstructionSpace, expires_at: float):
+        self.space = space
+        self.expires_at = expires_at
+        self.lock = asyncio.Lock()
+
+
+class ConstructionSpaceStore:
+    """In-memory LRU store of construction spaces with a sliding TTL."""
+
+    def __init__(self, max_spaces: int = 1024, ttl_seconds: float = 3600.0):
+        self.max_spaces = max_spaces
+        self.ttl_seconds = ttl_seconds
+        self._spaces: "OrderedDict[str, _StoredSpace]" = OrderedDict()
+
+    def create(self, space: ConstructionSpace) -> str:
+        """Store a space under a new ID and return the ID."""
+        space_id = str(uuid.uuid4())
+        self._spaces[space_id] = _StoredSpace(space, time.monotonic() + self.ttl_seconds)
+
+        # Evict least recently used spaces beyond capacity
+        while len(self._spaces) > self.max_spaces:
+            evicted_id, _ = self._spaces.popitem(last=False)
+            logger.debug("Evicted construction space", space_id=evicted_id)
+
+        return space_id
+
+    def get(self, space_id: str) -> Optional[ConstructionSpace]:
+        """Return a stored space, or None if it is unknown or expired."""
+        entry = self._touch(space_id)
+        return entry.space if entry else None
+
+    def lock(self, space_id: str) -> Optional[asyncio.Lock]:
+        """Return the lock serializing updates to a space, or None if unknown."""
+        entry = self._touch(space_id)
+        return entry.lock if entry else None
+
+    def put(self, space_id: str, space: ConstructionSpace) -> None:
+        """Replace the space stored under an existing ID."""
+        entry = self._touch(space_id)
+        if entry is None:
+            raise KeyError(space_id)
+        entry.space = space
+
+    def delete(self, space_id: str) -> bool:
+        """Remove a stored space. Returns whether it existed."""
+        return self._spaces.pop(space_id, None) is not None
+
+    def _touch(self, space_id: str) -> Optional[_StoredSpace]:
+        """Look up an entry, dropping it if expired and refreshing it otherwise."""
+        entry = self._spaces.get(space_id)
+        if entry is None:
+            return None
+
+        now = time.monotonic()
+        if entry.expires_at <= now:
+            del self._spaces[space_id]
+            return None
+
+        entry.expires_at = now + self.ttl_seconds
+        self._spaces.move_to_end(space_id)
+        return entry
+
+
+# Global store instance
+space_store = ConstructionSpaceStore(
+    max_spaces=settings.space_store_max_spaces,
+    ttl_seconds=settings.space_store_ttl_seconds
+)
+
+
+async def get_space_store() -> ConstructionSpaceStore:
+    """Get the construction space store instance."""
+    return space_store
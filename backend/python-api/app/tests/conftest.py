@@ -81,7 +81,7 @@ def mock_neo4j_service() -> Neo4jService:
     mock_service.health_check = AsyncMock(return_value={
         "status": "healthy",
         "database": "test",
-        "components": []
+        "server": {}
     })
     mock_service.connect = AsyncMock(return_value=True)
     mock_service.disconnect = AsyncMock()
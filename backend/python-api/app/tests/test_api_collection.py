@@ -64,6 +64,33 @@ class TestPlayerCollection:
         collection = data["collection"]
         assert collection["player_id"] == "nonexistent_player"
         assert collection["total_elements"] >= 0
+    
+    async def test_get_player_collections_batch(self, async_client: AsyncClient):
+        """Test fetching several player collections in one call."""
+        player_ids = ["batch_player_1", "batch_player_2", "batch_player_3"]
+        response = await async_client.post(
+            "/api/v1/collection/player/batch",
+            json={"player_ids": player_ids}
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert set(data.keys()) == set(player_ids)
+        for player_id in player_ids:
+            required_fields = ["collection", "available_elements", "next_unlockable"]
+            assert_api_response_structure(data[player_id], required_fields)
+            assert data[player_id]["collection"]["player_id"] == player_id
+    
+    async def test_get_player_collections_batch_size_limits(self, async_client: AsyncClient):
+        """Test that empty and oversized batches are rejected."""
+        for player_ids in [[], [f"player_{i}" for i in range(101)]]:
+            response = await async_client.post(
+                "/api/v1/collection/player/batch",
+                json={"player_ids": player_ids}
+            )
+            
+            assert response.status_code == 422
 
 
 class TestElementUnlocking:
@@ -169,6 +196,41 @@ class TestElementUnlocking:
             for element in data["unlocked_elements"]
         )
         assert not legendary_unlocked
+    
+    async def test_unlock_element_owned_elements_enforce_requirements(self, async_client: AsyncClient):
+        """Test that owned_elements gates unlocking on prerequisite elements."""
+        construction_space = {
+            "points": {
+                "point_a": {"id": "point_a", "x": 0, "y": 0},
+                "point_b": {"id": "point_b", "x": 100, "y": 0}
+            },
+            "lines": {
+                f"line_{i}": {"id": f"line_{i}", "point1_id": "point_a", "point2_id": "point_b"}
+                for i in range(3)
+            },
+            "circles": {
+                f"circle_{i}": {"id": f"circle_{i}", "center_id": "point_a", "radius_point_id": "point_b"}
+                for i in range(2)
+            },
+            "history": []
+        }
+        
+        for owned_elements, expected in [
+            (["basic_point"], False),
+            (["basic_point", "line_segment", "circle"], True)
+        ]:
+            response = await async_client.post(
+                "/api/v1/collection/unlock-element",
+                json={
+                    "player_id": "test_player",
+                    "construction_space": construction_space,
+                    "completed_construction": "equilateral_triangle",
+                    "owned_elements": owned_elements
+                }
+            )
+            
+            assert response.status_code == 200
+            assert response.json()["success"] is expected
 
 
 class TestElementListing:
@@ -0,0 +1,119 @@
+"""
+Tests for construction API endpoints.
+
+Tests construction sequence validation and execution through the REST API.
+"""
+
+import pytest
+from httpx import AsyncClient
+
+from app.services.rust_bridge import RustGeometryService, get_rust_service
+
+
+def _two_point_space() -> dict:
+    """Construction space holding the given points A and B."""
+    return {
+        "points": {
+            "point_A": {"id": "point_A", "x": 0, "y": 0, "label": "A"},
+            "point_B": {"id": "point_B", "x": 100, "y": 0, "label": "B"}
+        },
+        "lines": {},
+        "circles": {},
+        "history": []
+    }
+
+
+def _step(
+    step_number: int, step_type: str, dependencies: list, created_objects: list = (), **metadata
+) -> dict:
+    """Build a construction step request body."""
+    return {
+        "step_number": step_number,
+        "step_type": step_type,
+        "description": f"Step {step_number}",
+        "dependencies": dependencies,
+        "created_objects": list(created_objects),
+        "metadata": metadata
+    }
+
+
+class TestSequenceExecution:
+    """Test construction sequence execution."""
+    
+    @pytest.mark.skipif(
+        get_rust_service().rust_binary_path is None,
+        reason="Batch execution requires the Rust geometry engine"
+    )
+    async def test_batch_execution_matches_per_step(self, async_client: AsyncClient, monkeypatch):
+        """Test that one engine call gives the same step results as executing each step."""
+        sequence = {
+            "name": "Batch parity",
+            "description": "Steps that succeed and then fail",
+            "steps": [
+                _step(1, "add_point", [], ["point_P"], x=50, y=50, label="P"),
+                _step(2, "construct_circle", ["point_P", "point_B"]),
+                _step(3, "construct_line", ["point_A", "point_P"]),
+                _step(4, "construct_line", ["point_A", "point_A"]),
+                _step(5, "construct_line", ["point_A", "point_B"])
+            ]
+        }
+        
+        async def execute() -> dict:
+            response = await async_client.post(
+                "/api/v1/construction/execute-sequence",
+                json={"sequence": sequence, "initial_construction_space": _two_point_space()}
+            )
+            assert response.status_code == 200
+            data = response.json()
+            final_space = data["final_construction_space"]
+            return {
+                "steps": [
+                    (result["success"], result.get("error"), result.get("result", {}).get("type"))
+                    for result in data["execution_results"]
+                ],
+                "summary": data["summary"],
+                "counts": {
+                    key: len(final_space[key]) for key in ("points", "lines", "circles", "history")
+                }
+            }
+        
+        batch = await execute()
+        monkeypatch.setattr(
+            RustGeometryService, "supports_batch_execution", property(lambda self: False)
+        )
+        per_step = await execute()
+        
+        assert batch == per_step
+        assert batch["summary"]["successful_steps"] == 3
+        assert "identical points" in batch["steps"][3][1]
+    
+    async def test_steps_depend_on_earlier_created_objects(self, async_client: AsyncClient, monkeypatch):
+        """Test that a step can depend on an earlier step's output by its declared name."""
+        monkeypatch.setattr(
+            RustGeometryService, "supports_batch_execution", property(lambda self: False)
+        )
+        sequence = {
+            "name": "Named outputs",
+            "description": "Later steps reference the point created in step 1",
+            "steps": [
+                _step(1, "add_point", [], ["point_P"], x=50, y=50, label="P"),
+                _step(2, "construct_line", ["point_A", "point_P"], ["line_AP"]),
+                _step(3, "construct_circle", ["point_P", "point_B"], ["circle_P"])
+            ]
+        }
+        
+        response = await async_client.post(
+            "/api/v1/construction/execute-sequence",
+            json={"sequence": sequence, "initial_construction_space": _two_point_space()}
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["summary"]["overall_success"] is True
+        
+        point_id = data["execution_results"][0]["result"]["created_id"]
+        final_space = data["final_construction_space"]
+        line = final_space["lines"][data["execution_results"][1]["result"]["created_id"]]
+        circle = final_space["circles"][data["execution_results"][2]["result"]["created_id"]]
+        assert line["point2_id"] == point_id
+        assert circle["center_id"] == point_id
@@ -361,6 +361,117 @@ class TestGeometryIntegration:
         summary = summary_response.json()["summary"]
         assert summary["point_count"] >= 3
     
+    async def test_stored_space_incremental_construction(self, async_client: AsyncClient):
+        """Test building a construction against a server-side space by ID."""
+        response = await async_client.post("/api/v1/geometry/construction-space")
+        space_id = response.json()["space_id"]
+        assert space_id is not None
+        
+        point_ids = []
+        for point_data in [{"x": 0, "y": 0, "label": "A"}, {"x": 100, "y": 0, "label": "B"}]:
+            response = await async_client.post(
+                f"/api/v1/geometry/spaces/{space_id}/points",
+                json=point_data
+            )
+            assert response.status_code == 200
+            data = response.json()
+            assert_api_response_structure(data, ["space_id", "operation", "created_id", "created"])
+            assert data["created"]["label"] == point_data["label"]
+            point_ids.append(data["created_id"])
+        
+        response = await async_client.post(
+            f"/api/v1/geometry/spaces/{space_id}/lines",
+            json={"point1_id": point_ids[0], "point2_id": point_ids[1]}
+        )
+        assert response.status_code == 200
+        line_id = response.json()["created_id"]
+        
+        # Only deltas were exchanged; the full space is kept on the server
+        response = await async_client.get(f"/api/v1/geometry/spaces/{space_id}")
+        assert response.status_code == 200
+        construction_space = response.json()["construction_space"]
+        assert set(construction_space["points"]) == set(point_ids)
+        assert line_id in construction_space["lines"]
+        
+        response = await async_client.delete(f"/api/v1/geometry/spaces/{space_id}")
+        assert response.status_code == 200
+        
+        response = await async_client.get(f"/api/v1/geometry/spaces/{space_id}")
+        assert response.status_code == 404
+    
+    async def test_stored_space_keeps_objects_with_engine(self, async_client: AsyncClient, monkeypatch):
+        """Test that engine results are merged into the stored space rather than replacing it."""
+        from app.services.rust_bridge import get_rust_service
+        
+        rust_service = get_rust_service()
+    
+        async def partial_engine(command):
+            # Echo only the created object, as older engine builds did
+            object_id = f"{command['command']}_{len(command['construction_space']['points'])}"
+            space = {"points": {}, "lines": {}, "circles": {}, "history": []}
+            if command["command"] == "add_point":
+                space["points"][object_id] = {"id": object_id, "x": command["x"], "y": command["y"]}
+                space["history"].append({"action": "add_point", "point_id": object_id})
+                return {"point_id": object_id, "construction_space": space}
+            space["lines"][object_id] = {
+                "id": object_id,
+                "point1_id": command["point1_id"],
+                "point2_id": command["point2_id"]
+            }
+            return {"line_id": object_id, "construction_space": space}
+        
+        monkeypatch.setattr(rust_service, "rust_binary_path", "nerv-geometry-server")
+        monkeypatch.setattr(rust_service, "_execute_rust_command", partial_engine)
+        
+        response = await async_client.post("/api/v1/geometry/construction-space")
+        space_id = response.json()["space_id"]
+        
+        point_ids = []
+        for point_data in [{"x": 0, "y": 0}, {"x": 100, "y": 0}]:
+            response = await async_client.post(
+                f"/api/v1/geometry/spaces/{space_id}/points",
+                json=point_data
+            )
+            assert response.status_code == 200
+            point_ids.append(response.json()["created_id"])
+        
+        response = await async_client.post(
+            f"/api/v1/geometry/spaces/{space_id}/lines",
+            json={"point1_id": point_ids[0], "point2_id": point_ids[1]}
+        )
+        assert response.status_code == 200
+        line_id = response.json()["created_id"]
+        
+        response = await async_client.get(f"/api/v1/geometry/spaces/{space_id}")
+        construction_space = response.json()["construction_space"]
+        assert set(construction_space["points"]) == set(point_ids)
+        assert line_id in construction_space["lines"]
+        assert [entry["point_id"] for entry in construction_space["history"]] == point_ids
+    
+    async def test_stored_space_evicted_during_update(self, async_client: AsyncClient, monkeypatch):
+        """Test that a space dropped while the engine runs is reported as not found."""
+        from app.services.rust_bridge import get_rust_service
+        from app.services.space_store import space_store
+        
+        rust_service = get_rust_service()
+        response = await async_client.post("/api/v1/geometry/construction-space")
+        space_id = response.json()["space_id"]
+    
+        async def evicting_engine(command):
+            space_store.delete(space_id)
+            point = {"id": "point_1", "x": command["x"], "y": command["y"]}
+            space = {"points": {"point_1": point}, "lines": {}, "circles": {}, "history": []}
+            return {"point_id": "point_1", "construction_space": space}
+        
+        monkeypatch.setattr(rust_service, "rust_binary_path", "nerv-geometry-server")
+        monkeypatch.setattr(rust_service, "_execute_rust_command", evicting_engine)
+        
+        response = await async_client.post(
+            f"/api/v1/geometry/spaces/{space_id}/points",
+            json={"x": 0, "y": 0}
+        )
+        assert response.status_code == 404
+    
     async def test_error_handling_consistency(self, async_client: AsyncClient):
         """Test that all endpoints handle errors consistently."""
         # Test with completely invalid data
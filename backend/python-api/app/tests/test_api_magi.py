@@ -305,6 +305,34 @@ class TestErrorAnalysis:
         
         assert isinstance(data["corrective_steps"], list)
         assert "context_notes" in data
+    
+    async def test_analyze_error_negated_intersection(self, async_client: AsyncClient):
+        """Test that negations like "cannot" and "don't" classify as no intersection."""
+        empty_space = {"points": {}, "lines": {}, "circles": {}, "history": []}
+        for description in [
+            "Cannot find intersection of the circles",
+            "The lines don't intersect",
+            "Circles can't intersect here"
+        ]:
+            response = await async_client.post(
+                "/api/v1/magi/analyze-error",
+                params={"error_description": description},
+                json=empty_space
+            )
+            
+            assert response.status_code == 200
+            assert response.json()["error_type"] == "no_intersection", description
+    
+    async def test_analyze_error_plural_construction_failure(self, async_client: AsyncClient):
+        """Test that plural forms still classify as a construction failure."""
+        response = await async_client.post(
+            "/api/v1/magi/analyze-error",
+            params={"error_description": "Constructions failed"},
+            json={"points": {}, "lines": {}, "circles": {}, "history": []}
+        )
+        
+        assert response.status_code == 200
+        assert response.json()["error_type"] == "construction_failure"
 
 
 class TestTheoremInfo:
@@ -6,6 +6,7 @@
  */
 
 use serde_json::{Value, json};
+use std::collections::HashMap;
 use std::io::{self, Read};
 
 fn main() {
@@ -56,31 +57,12 @@ fn process_command(command: Value) -> Value {
             let y = command.get("y").and_then(|v| v.as_f64()).unwrap_or(0.0);
             let label = command.get("label").and_then(|v| v.as_str()).unwrap_or("");
             
-            // Generate a unique ID for the point
-            let uuid_str = uuid::Uuid::new_v4().to_string();
-            let point_id = format!("point_{}", &uuid_str[..8]);
+            let mut space = input_space(&command);
+            let point_id = insert_point(&mut space, x, y, label);
             
             json!({
                 "point_id": point_id,
-                "construction_space": {
-                    "points": {
-                        point_id.clone(): {
-                            "id": point_id,
-                            "x": x,
-                            "y": y,
-                            "label": label
-                        }
-                    },
-                    "lines": {},
-                    "circles": {},
-                    "history": [{
-                        "action": "add_point",
-                        "point_id": point_id,
-                        "x": x,
-                        "y": y,
-                        "timestamp": chrono::Utc::now().to_rfc3339()
-                    }]
-                }
+                "construction_space": space
             })
         }
         
@@ -92,21 +74,17 @@ fn process_command(command: Value) -> Value {
             let uuid_str = uuid::Uuid::new_v4().to_string();
             let line_id = format!("line_{}", &uuid_str[..8]);
             
+            let mut space = input_space(&command);
+            space["lines"][&line_id] = json!({
+                "id": line_id,
+                "point1_id": point1_id,
+                "point2_id": point2_id,
+                "label": label
+            });
+            
             json!({
                 "line_id": line_id,
-                "construction_space": {
-                    "points": command.get("construction_space").unwrap_or(&json!({})).get("points").unwrap_or(&json!({})),
-                    "lines": {
-                        line_id.clone(): {
-                            "id": line_id,
-                            "point1_id": point1_id,
-                            "point2_id": point2_id,
-                            "label": label
-                        }
-                    },
-                    "circles": {},
-                    "history": []
-                }
+                "construction_space": space
             })
         }
         
@@ -118,21 +96,17 @@ fn process_command(command: Value) -> Value {
             let uuid_str = uuid::Uuid::new_v4().to_string();
             let circle_id = format!("circle_{}", &uuid_str[..8]);
             
+            let mut space = input_space(&command);
+            space["circles"][&circle_id] = json!({
+                "id": circle_id,
+                "center_id": center_id,
+                "radius_point_id": radius_point_id,
+                "label": label
+            });
+            
             json!({
                 "circle_id": circle_id,
-                "construction_space": {
-                    "points": command.get("construction_space").unwrap_or(&json!({})).get("points").unwrap_or(&json!({})),
-                    "lines": command.get("construction_space").unwrap_or(&json!({})).get("lines").unwrap_or(&json!({})),
-                    "circles": {
-                        circle_id.clone(): {
-                            "id": circle_id,
-                            "center_id": center_id,
-                            "radius_point_id": radius_point_id,
-                            "label": label
-                        }
-                    },
-                    "history": []
-                }
+                "construction_space": space
             })
         }
         
@@ -158,10 +132,189 @@ fn process_command(command: Value) -> Value {
             })
         }
         
+        Some("validate_sequence") => {
+            let steps = command.get("steps").and_then(|v| v.as_array()).cloned().unwrap_or_default();
+            
+            // Every step is validated against the same space in one call,
+            // mirroring validate_construction for each entry
+            let results: Vec<Value> = steps.iter().map(|_| json!({
+                "is_valid": true,
+                "errors": []
+            })).collect();
+            
+            json!({
+                "results": results
+            })
+        }
+        
+        Some("execute_sequence") => {
+            let mut space = input_space(&command);
+            let steps = command.get("steps").and_then(|v| v.as_array()).cloned().unwrap_or_default();
+            
+            // The space stays in memory between steps; execution stops at
+            // the first failure and the partial results are returned.
+            // Names a step declares in created_objects map to the ID the
+            // engine assigned, so later steps can depend on them.
+            let mut created_ids: HashMap<String, String> = HashMap::new();
+            let mut results = Vec::with_capacity(steps.len());
+            for step in &steps {
+                match execute_step(&mut space, step, &created_ids) {
+                    Ok(result) => {
+                        let declared = step.get("created_objects")
+                            .and_then(|v| v.get(0))
+                            .and_then(|v| v.as_str());
+                        let created = result.get("created_id").and_then(|v| v.as_str());
+                        if let (Some(declared), Some(created)) = (declared, created) {
+                            created_ids.insert(declared.to_string(), created.to_string());
+                        }
+                        results.push(result);
+                    }
+                    Err((error_kind, error)) => {
+                        results.push(json!({
+                            "success": false,
+                            "error": error,
+                            "error_kind": error_kind
+                        }));
+                        break;
+                    }
+                }
+            }
+            
+            json!({
+                "results": results,
+                "construction_space": space
+            })
+        }
+        
         _ => {
             json!({
                 "error": format!("Unknown command: {:?}", cmd_type)
             })
         }
     }
-}
\ No newline at end of file
+}
+
+/// The construction space sent with a command, or an empty one.
+/// Commands echo the full space back with their changes applied.
+fn input_space(command: &Value) -> Value {
+    command.get("construction_space").cloned().unwrap_or_else(|| json!({
+        "points": {}, "lines": {}, "circles": {}, "history": []
+    }))
+}
+
+/// Add a point to the space, recording it in the history, and return its ID.
+/// Shared by the add_point command and the add_point batch step.
+fn insert_point(space: &mut Value, x: f64, y: f64, label: &str) -> String {
+    let uuid_str = uuid::Uuid::new_v4().to_string();
+    let point_id = format!("point_{}", &uuid_str[..8]);
+    
+    space["points"][&point_id] = json!({
+        "id": point_id,
+        "x": x,
+        "y": y,
+        "label": label
+    });
+    push_history(space, json!({
+        "action": "add_point",
+        "point_id": point_id,
+        "x": x,
+        "y": y,
+        "timestamp": chrono::Utc::now().to_rfc3339()
+    }));
+    
+    point_id
+}
+
+fn push_history(space: &mut Value, entry: Value) {
+    match space["history"].as_array_mut() {
+        Some(history) => history.push(entry),
+        None => space["history"] = json!([entry]),
+    }
+}
+
+/// A failed batch step: "validation" for malformed steps, "geometry" for
+/// steps the space cannot satisfy, mirroring the errors the API raises when
+/// it runs the same step through the single-step commands.
+type StepError = (&'static str, String);
+
+fn execute_step(
+    space: &mut Value,
+    step: &Value,
+    created_ids: &HashMap<String, String>
+) -> Result<Value, StepError> {
+    let step_type = step.get("step_type").and_then(|v| v.as_str()).unwrap_or("");
+    let dependencies: Vec<&str> = step.get("dependencies")
+        .and_then(|v| v.as_array())
+        .map(|deps| deps.iter()
+            .filter_map(|d| d.as_str())
+            .map(|d| created_ids.get(d).map(String::as_str).unwrap_or(d))
+            .collect())
+        .unwrap_or_default();
+    let metadata = step.get("metadata").cloned().unwrap_or_else(|| json!({}));
+    let label = metadata.get("label").and_then(|v| v.as_str()).unwrap_or("");
+    let has_point = |space: &Value, id: &str| space.get("points").and_then(|p| p.get(id)).is_some();
+    
+    match step_type {
+        "add_point" => {
+            let x = metadata.get("x").and_then(|v| v.as_f64()).unwrap_or(0.0);
+            let y = metadata.get("y").and_then(|v| v.as_f64()).unwrap_or(0.0);
+            let point_id = insert_point(space, x, y, label);
+            
+            Ok(json!({"success": true, "created_id": point_id, "type": "point"}))
+        }
+        
+        "construct_line" | "construct_circle" => {
+            let is_line = step_type == "construct_line";
+            if dependencies.len() != 2 {
+                let shape = if is_line { "Line" } else { "Circle" };
+                return Err(("validation", format!("{} requires exactly 2 points", shape)));
+            }
+            for dep in &dependencies {
+                if !has_point(space, dep) {
+                    return Err(("geometry", format!("Point not found: {}", dep)));
+                }
+            }
+            if dependencies[0] == dependencies[1] {
+                let message = if is_line {
+                    "Cannot create line with identical points"
+                } else {
+                    "Center and radius point cannot be the same"
+                };
+                return Err(("geometry", message.to_string()));
+            }
+            
+            let uuid_str = uuid::Uuid::new_v4().to_string();
+            if is_line {
+                let line_id = format!("line_{}", &uuid_str[..8]);
+                space["lines"][&line_id] = json!({
+                    "id": line_id,
+                    "point1_id": dependencies[0],
+                    "point2_id": dependencies[1],
+                    "label": label,
+                    "dependencies": [dependencies[0], dependencies[1]]
+                });
+                Ok(json!({"success": true, "created_id": line_id, "type": "line"}))
+            } else {
+                let circle_id = format!("circle_{}", &uuid_str[..8]);
+                space["circles"][&circle_id] = json!({
+                    "id": circle_id,
+                    "center_id": dependencies[0],
+                    "radius_point_id": dependencies[1],
+                    "label": label,
+                    "dependencies": [dependencies[0], dependencies[1]]
+                });
+                Ok(json!({"success": true, "created_id": circle_id, "type": "circle"}))
+            }
+        }
+        
+        // Intersections are not computed yet; failing here keeps a batch
+        // from reporting success for a step that produced nothing. The API
+        // runs sequences with this step through the single-step commands.
+        "find_intersections" => Err((
+            "validation",
+            "Unsupported step type in batch execution: find_intersections".to_string()
+        )),
+        
+        _ => Err(("validation", format!("Unknown step type: {}", step_type))),
+    }
+}